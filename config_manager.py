@@ -3,6 +3,7 @@ import os
 import sys
 import shutil
 import logging
+import threading
 from pathlib import Path
 from constants import (
     DEFAULT_NOTIFICATION_LEVEL,
@@ -31,6 +32,9 @@ class ConfigManager:
             app_name: The name of the application, used for the config directory.
         """
         self.app_name = app_name
+        # Saves may run off the UI thread (e.g. the close-time flush), so
+        # serialize writers; the atomic rename keeps readers consistent.
+        self._save_lock = threading.Lock()
         self.config_dir = self._get_config_dir()
         self.config_file = self.config_dir / "config.json"
         self.default_config = {
@@ -153,9 +157,12 @@ class ConfigManager:
     def save_config(self):
         """Saves the current configuration to the JSON file."""
         try:
-            self.config_dir.mkdir(parents=True, exist_ok=True) # Ensure dir exists
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=4)
+            with self._save_lock:
+                self.config_dir.mkdir(parents=True, exist_ok=True) # Ensure dir exists
+                tmp_file = self.config_file.with_name(self.config_file.name + '.tmp')
+                with open(tmp_file, 'w') as f:
+                    json.dump(self.config, f, indent=4)
+                os.replace(tmp_file, self.config_file)
         except Exception as e:
             logger.error("Error saving config: %s", e)
 
@@ -1,5 +1,4 @@
 import sys
-import queue
 import threading
 import os
 import logging
@@ -14,6 +13,7 @@ from PyQt6.QtCore import pyqtSlot
 from config_manager import ConfigManager
 from history_manager import HistoryManager
 from ui_config_window import ConfigWindow
+from utils import BoundedLogQueue
 from constants import APP_NAME
 
 logger = logging.getLogger(__name__)
@@ -108,7 +108,9 @@ class AutoTidyApp(QApplication):
             sys.exit(1)
 
         self.config_manager = ConfigManager(APP_NAME) # Pass APP_NAME here
-        self.log_queue = queue.Queue()
+        # Bounded with drop-oldest semantics so a runaway worker cannot grow
+        # the backlog without limit; the UI drain stays bounded per tick too.
+        self.log_queue = BoundedLogQueue(maxsize=10000)
 
         # Create UI (initially hidden)
         self.config_window = ConfigWindow(self.config_manager, self.log_queue)        # Create Tray Icon
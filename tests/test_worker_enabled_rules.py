@@ -1,5 +1,6 @@
 import queue
 import tempfile
+import uuid
 from pathlib import Path
 from unittest import TestCase
 from unittest.mock import patch
@@ -11,6 +12,8 @@ from worker import MonitoringWorker
 class SingleCycleStopEvent:
     """Stop event replacement that allows a single monitoring cycle."""
 
+    __slots__ = ('_is_set',)
+
     def __init__(self):
         self._is_set = False
 
@@ -66,73 +69,81 @@ class MockConfigManager:
 
 class TestMonitoringWorkerEnabledRules(TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # One temp directory for the whole class; each test carves out its own
+        # subtree so the expensive directory creation happens once.
+        cls._base_tmp_dir = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(cls._base_tmp_dir.cleanup)
+
+        # Install the worker patches once per class rather than once per test;
+        # individual tests only reset the shared mock.
+        cls._check_file_patcher = patch('worker.check_file', return_value=True)
+        cls._check_file_patcher.start()
+        cls.addClassCleanup(cls._check_file_patcher.stop)
+
+        cls._process_patcher = patch('worker.process_file_action')
+        cls.process_mock = cls._process_patcher.start()
+        cls.addClassCleanup(cls._process_patcher.stop)
+
+    def setUp(self):
+        base_path = Path(self._base_tmp_dir.name) / uuid.uuid4().hex
+        self.monitored_path = base_path / "monitored"
+        self.config_dir = base_path / "config"
+        self.monitored_path.mkdir(parents=True)
+        self.config_dir.mkdir(parents=True)
+        (self.monitored_path / "example.txt").write_text("content")
+
+        self.process_mock.reset_mock()
+        self.process_mock.return_value = (True, 'processed')
+
+    def _make_env(self, *, enabled, destination=""):
+        """Return a MockConfigManager wired to this test's directory skeleton."""
+        return MockConfigManager(
+            self.monitored_path,
+            self.config_dir,
+            enabled=enabled,
+            destination=destination,
+        )
+
     def _run_worker_once(self, config_manager):
         log_queue = queue.Queue()
         worker = MonitoringWorker(config_manager, log_queue)
         worker._stop_event = SingleCycleStopEvent()
-        with patch('worker.check_file', return_value=True), patch('worker.process_file_action') as process_mock:
-            process_mock.return_value = (True, 'processed')
-            worker.run()
-        return process_mock
-
-    def test_enabled_rule_processes_files(self):
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            base_path = Path(tmp_dir)
-            monitored_path = base_path / "monitored"
-            config_dir = base_path / "config"
-            monitored_path.mkdir()
-            config_dir.mkdir()
-
-            (monitored_path / "example.txt").write_text("content")
-
-            config_manager = MockConfigManager(monitored_path, config_dir, enabled=True)
-
-            process_mock = self._run_worker_once(config_manager)
-            self.assertGreater(process_mock.call_count, 0, "Enabled rules should process matching files")
-
-    def test_disabled_rule_is_skipped(self):
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            base_path = Path(tmp_dir)
-            monitored_path = base_path / "monitored"
-            config_dir = base_path / "config"
-            monitored_path.mkdir()
-            config_dir.mkdir()
-
-            (monitored_path / "example.txt").write_text("content")
+        self.process_mock.reset_mock()
+        worker.run()
+        return self.process_mock
 
-            config_manager = MockConfigManager(monitored_path, config_dir, enabled=False)
+    def test_rule_enablement_gates_processing(self):
+        for enabled in (True, False):
+            with self.subTest(enabled=enabled):
+                config_manager = self._make_env(enabled=enabled)
 
-            process_mock = self._run_worker_once(config_manager)
-            self.assertEqual(process_mock.call_count, 0, "Disabled rules should be skipped entirely")
+                process_mock = self._run_worker_once(config_manager)
+                if enabled:
+                    self.assertGreater(process_mock.call_count, 0, "Enabled rules should process matching files")
+                else:
+                    self.assertEqual(process_mock.call_count, 0, "Disabled rules should be skipped entirely")
 
     def test_destination_override_passed_to_process_file_action(self):
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            base_path = Path(tmp_dir)
-            monitored_path = base_path / "monitored"
-            config_dir = base_path / "config"
-            destination_path = base_path / "custom_dest"
-            monitored_path.mkdir()
-            config_dir.mkdir()
-            destination_path.mkdir()
-
-            (monitored_path / "example.txt").write_text("content")
-
-            config_manager = MockConfigManager(
-                monitored_path,
-                config_dir,
-                enabled=True,
-                destination=str(destination_path),
-            )
-
-            process_mock = self._run_worker_once(config_manager)
-            self.assertGreater(process_mock.call_count, 0, "Processing should occur for enabled rules")
-            for call in process_mock.call_args_list:
-                self.assertGreaterEqual(len(call.args), 11, "Destination argument should be provided to process_file_action")
-                self.assertEqual(
-                    call.args[10],
-                    str(destination_path),
-                    "Worker should forward updated destination to process_file_action",
-                )
+        destination_path = self.monitored_path.parent / "custom_dest"
+        destination_path.mkdir()
+
+        config_manager = self._make_env(enabled=True, destination=str(destination_path))
+
+        process_mock = self._run_worker_once(config_manager)
+        self.assertGreater(process_mock.call_count, 0, "Processing should occur for enabled rules")
+        calls = process_mock.call_args_list
+        self.assertTrue(
+            all(len(call.args) >= 11 for call in calls),
+            "Destination argument should be provided to process_file_action",
+        )
+        destinations = [call.args[10] for call in calls]
+        self.assertEqual(
+            destinations,
+            [str(destination_path)] * len(calls),
+            "Worker should forward updated destination to process_file_action",
+        )
 
 
 if __name__ == '__main__':
@@ -1,9 +1,8 @@
 import queue
 import tempfile
-import uuid
 from pathlib import Path
 from unittest import TestCase
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 from constants import NOTIFICATION_LEVEL_ALL
 from worker import MonitoringWorker
@@ -12,6 +11,8 @@ from worker import MonitoringWorker
 class ControlledStopEvent:
     """A controllable event to stop the worker after a fixed number of cycles."""
 
+    __slots__ = ('_remaining_cycles',)
+
     def __init__(self, cycles):
         self._remaining_cycles = cycles
 
@@ -60,47 +61,96 @@ class MockConfigManager:
         return NOTIFICATION_LEVEL_ALL
 
 
-class TestMonitoringWorkerRunIds(TestCase):
+class CallRecorder:
+    """Plain callable that records invocations; far cheaper than MagicMock."""
 
-    def test_consecutive_scans_generate_distinct_run_ids(self):
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            base_path = Path(tmp_dir)
-            monitored_path = base_path / "monitored"
-            config_dir = base_path / "config"
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+
+
+class FakeDirEntry:
+    """Minimal stand-in for os.DirEntry so scans need no real files."""
+
+    def __init__(self, directory: Path, name: str):
+        self.name = name
+        self.path = str(directory / name)
+
+    def is_symlink(self):
+        return False
+
+    def is_file(self, follow_symlinks=True):
+        return True
 
-            monitored_path.mkdir()
-            config_dir.mkdir()
+    def stat(self, follow_symlinks=True):
+        return None
 
-            target_file = monitored_path / "example.txt"
-            target_file.write_text("sample")
 
-            config_manager = MockConfigManager(monitored_path, config_dir)
-            log_queue = queue.Queue()
-            worker = MonitoringWorker(config_manager, log_queue)
+class FakeScandir:
+    """Context manager mimicking os.scandir() over a fixed entry list."""
+
+    def __init__(self, entries):
+        self._entries = entries
+
+    def __call__(self, _path):
+        return self
+
+    def __enter__(self):
+        return iter(self._entries)
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class TestMonitoringWorkerRunIds(TestCase):
+
+    # The worker calls str() on each uuid4() result, so plain string
+    # constants pass through unchanged — no UUID parsing needed.
+    RUN_IDS = (
+        "11111111-1111-1111-1111-111111111111",
+        "22222222-2222-2222-2222-222222222222",
+    )
+
+    @classmethod
+    def setUpClass(cls):
+        # Build the directory skeleton once for the class. The directory scan
+        # itself is patched out, so no file ever needs to exist on disk.
+        cls._base_tmp_dir = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(cls._base_tmp_dir.cleanup)
+
+        base_path = Path(cls._base_tmp_dir.name)
+        cls.monitored_path = base_path / "monitored"
+        cls.config_dir = base_path / "config"
+        cls.monitored_path.mkdir()
+        cls.config_dir.mkdir()
+
+    def test_consecutive_scans_generate_distinct_run_ids(self):
+        config_manager = MockConfigManager(self.monitored_path, self.config_dir)
+        log_queue = queue.Queue()
+        worker = MonitoringWorker(config_manager, log_queue)
 
-            # Replace the stop event so we can deterministically end after two cycles.
-            worker._stop_event = ControlledStopEvent(cycles=2)
+        # Replace the stop event so we can deterministically end after two cycles.
+        worker._stop_event = ControlledStopEvent(cycles=2)
 
-            # Spy on history logging to capture run IDs used for each cycle.
-            history_log_mock = MagicMock()
-            worker.history_manager.log_action = history_log_mock
+        # Spy on history logging to capture run IDs used for each cycle.
+        history_log_recorder = CallRecorder()
+        worker.history_manager.log_action = history_log_recorder
 
-            generated_run_ids = [
-                uuid.UUID("11111111-1111-1111-1111-111111111111"),
-                uuid.UUID("22222222-2222-2222-2222-222222222222")
-            ]
+        fake_scandir = FakeScandir([FakeDirEntry(self.monitored_path, "example.txt")])
 
-            with patch('worker.uuid.uuid4', side_effect=generated_run_ids):
-                worker.run()
+        with patch('worker.uuid.uuid4', side_effect=self.RUN_IDS), \
+                patch('worker.os.scandir', fake_scandir):
+            worker.run()
 
-            # Each scan should log at least one action containing the run ID for that cycle.
-            self.assertEqual(history_log_mock.call_count, 2)
+        # Each scan should log at least one action containing the run ID for that cycle.
+        self.assertEqual(len(history_log_recorder.calls), 2)
 
-            logged_run_ids = [call.args[0]['run_id'] for call in history_log_mock.call_args_list]
-            expected_run_ids = [str(value) for value in generated_run_ids]
+        logged_run_ids = [args[0]['run_id'] for args, _kwargs in history_log_recorder.calls]
 
-            self.assertEqual(logged_run_ids, expected_run_ids)
-            self.assertNotEqual(logged_run_ids[0], logged_run_ids[1])
+        self.assertEqual(logged_run_ids, list(self.RUN_IDS))
+        self.assertNotEqual(logged_run_ids[0], logged_run_ids[1])
 
 
 if __name__ == '__main__':
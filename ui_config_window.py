@@ -1,16 +1,22 @@
+import functools
+import io
 import os
 import sys
 import queue
 import re
 import html
 import logging
+import threading
+import time
+from collections import deque
 from datetime import datetime, timedelta
+from types import MappingProxyType
 
 try:
     from PyQt6.QtWidgets import (
         QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QListWidget, QLineEdit,
-        QSpinBox, QLabel, QTextEdit, QFileDialog, QMessageBox, QListWidgetItem, QComboBox, QCheckBox,
-        QApplication, QMenu, QInputDialog, QGroupBox, QFormLayout, QStackedLayout, QStyle
+        QSpinBox, QLabel, QPlainTextEdit, QFileDialog, QMessageBox, QListWidgetItem, QComboBox, QCheckBox,
+        QApplication, QMenu, QInputDialog, QGroupBox, QFormLayout, QStyle
     )
 except ImportError:  # pragma: no cover - fallback for test environments with stubs
     from PyQt6 import QtWidgets as _QtWidgets  # type: ignore
@@ -23,7 +29,7 @@ except ImportError:  # pragma: no cover - fallback for test environments with st
     QLineEdit = getattr(_QtWidgets, "QLineEdit", object)
     QSpinBox = getattr(_QtWidgets, "QSpinBox", object)
     QLabel = getattr(_QtWidgets, "QLabel", object)
-    QTextEdit = getattr(_QtWidgets, "QTextEdit", object)
+    QPlainTextEdit = getattr(_QtWidgets, "QPlainTextEdit", object)
     QFileDialog = getattr(_QtWidgets, "QFileDialog", object)
     QMessageBox = getattr(_QtWidgets, "QMessageBox", object)
     QListWidgetItem = getattr(_QtWidgets, "QListWidgetItem", object)
@@ -34,7 +40,6 @@ except ImportError:  # pragma: no cover - fallback for test environments with st
     QInputDialog = getattr(_QtWidgets, "QInputDialog", object)
     QGroupBox = getattr(_QtWidgets, "QGroupBox", type("QGroupBox", (QWidget,), {}))
     QFormLayout = getattr(_QtWidgets, "QFormLayout", object)
-    QStackedLayout = getattr(_QtWidgets, "QStackedLayout", object)
     QStyle = getattr(_QtWidgets, "QStyle", object)
 
 try:
@@ -46,6 +51,8 @@ try:
         QColor,
         QFont,
         QPixmap,
+        QTextCharFormat,
+        QTextCursor,
     )
 except ImportError:  # pragma: no cover - fallback for test environments with stubs
     from PyQt6 import QtGui as _QtGui  # type: ignore
@@ -70,9 +77,22 @@ except ImportError:  # pragma: no cover - fallback for test environments with st
     QColor = getattr(_QtGui, "QColor", object)
     QFont = getattr(_QtGui, "QFont", object)
     QPixmap = getattr(_QtGui, "QPixmap", object)
+    QTextCharFormat = getattr(_QtGui, "QTextCharFormat", object)
+    QTextCursor = getattr(_QtGui, "QTextCursor", object)
 
 try:
-    from PyQt6.QtCore import QTimer, Qt, QUrl, pyqtSlot
+    from PyQt6.QtCore import (
+        QElapsedTimer,
+        QObject,
+        QRunnable,
+        QSignalBlocker,
+        QThreadPool,
+        QTimer,
+        Qt,
+        QUrl,
+        pyqtSignal,
+        pyqtSlot,
+    )
 except ImportError:  # pragma: no cover - fallback for test environments with stubs
     from PyQt6 import QtCore as _QtCore  # type: ignore
 
@@ -108,9 +128,31 @@ except ImportError:  # pragma: no cover - fallback for test environments with st
         def fromLocalFile(path):
             return path
 
+    class _SignalBlockerFallback:
+        """RAII-style stand-in that flips blockSignals when available."""
+
+        def __init__(self, obj):
+            self._obj = obj
+            if hasattr(obj, "blockSignals"):
+                obj.blockSignals(True)
+
+        def __del__(self):
+            obj = getattr(self, "_obj", None)
+            if obj is not None and hasattr(obj, "blockSignals"):
+                obj.blockSignals(False)
+
+    def _pyqt_signal_fallback(*_args, **_kwargs):
+        return None
+
+    QElapsedTimer = getattr(_QtCore, "QElapsedTimer", None)
+    QObject = getattr(_QtCore, "QObject", object)
+    QRunnable = getattr(_QtCore, "QRunnable", object)
+    QSignalBlocker = getattr(_QtCore, "QSignalBlocker", _SignalBlockerFallback)
+    QThreadPool = getattr(_QtCore, "QThreadPool", None)
     QTimer = getattr(_QtCore, "QTimer", object)
     Qt = getattr(_QtCore, "Qt", _QtFallback)
     QUrl = getattr(_QtCore, "QUrl", _QUrlFallback)
+    pyqtSignal = getattr(_QtCore, "pyqtSignal", _pyqt_signal_fallback)
     pyqtSlot = getattr(_QtCore, "pyqtSlot", _pyqt_slot_fallback)
 from pathlib import Path
 
@@ -127,22 +169,115 @@ from constants import (
 
 
 from undo_manager import UndoManager # Added for Undo functionality
-try:
-    from ui_undo_dialog import UndoDialog # Added for Undo functionality
-except ImportError:  # pragma: no cover - allow running without full UI stack
-    UndoDialog = object  # type: ignore[assignment]
-from utils import get_preview_matches, resolve_destination_for_preview
+# ui_undo_dialog is imported lazily in open_undo_dialog; its widget tree is
+# only needed once the user opens the history view.
+from utils import _compile_pattern, get_preview_matches, resolve_destination_for_preview
 
 LOG_QUEUE_CHECK_INTERVAL_MS = 250
-
-ACTION_VALUE_TO_TEXT = {
+# Poll rate while no worker is running; only direct UI actions enqueue
+# messages then, so the queue can be checked far less aggressively.
+LOG_QUEUE_IDLE_INTERVAL_MS = 1000
+# Wall-clock budget per drain pass; adapts to per-message cost where a
+# plain count cap cannot. The count cap stays as a hard ceiling for
+# environments whose Qt stubs lack QElapsedTimer.
+LOG_QUEUE_DRAIN_BUDGET_MS = 8
+# Most messages drained per tick; a flooding worker yields back to the
+# event loop after this many, and draining resumes on a zero-delay timer.
+LOG_QUEUE_DRAIN_LIMIT = 500
+MAX_LOG_ENTRIES = 5000  # Ring-buffer cap; oldest entries drop past this.
+RULE_SAVE_DEBOUNCE_MS = 200  # Coalesce rapid rule edits into one config write.
+SUMMARY_REFRESH_DEBOUNCE_MS = 50  # Coalesce keystrokes into one summary rebuild.
+
+# Read-only views; these are lookup tables shared by every window, so a
+# stray mutation would silently desynchronise the combo box and the config.
+ACTION_VALUE_TO_TEXT = MappingProxyType({
     "move": "Move",
     "copy": "Copy",
     "delete_to_trash": "Delete to Trash",
     "delete_permanently": "Delete Permanently",
-}
+})
+
+ACTION_TEXT_TO_VALUE = MappingProxyType({v: k for k, v in ACTION_VALUE_TO_TEXT.items()})
+# Combo-box index to action value; the combo is populated from
+# ACTION_VALUE_TO_TEXT so the orderings stay in sync by construction.
+ACTION_VALUES = tuple(ACTION_VALUE_TO_TEXT)
+
+# Prebound method aliases for slots that run per keystroke or per status
+# tick; saves the global + attribute lookup on each call.
+_action_text_to_value = ACTION_TEXT_TO_VALUE.get
+_action_value_to_text = ACTION_VALUE_TO_TEXT.get
+_escape = html.escape
+
+
+@functools.lru_cache(maxsize=256)
+def _expandvars_cached(path: str) -> str:
+    """Memoized os.path.expandvars; template paths repeat across applies."""
+    return os.path.expandvars(path)
+
 
-ACTION_TEXT_TO_VALUE = {v: k for k, v in ACTION_VALUE_TO_TEXT.items()}
+def _build_exclusion_help_html() -> str:
+    """Assemble the static exclusion-help dialog body once."""
+    glob_list_html = "".join(
+        f"<li><code>{_escape(pattern)}</code> – {_escape(description)}</li>"
+        for pattern, description in EXCLUSION_HELP_CONTENT["glob_examples"]
+    )
+    regex_list_html = "".join(
+        f"<li><code>{_escape(pattern)}</code> – {_escape(description)}</li>"
+        for pattern, description in EXCLUSION_HELP_CONTENT["regex_examples"]
+    )
+    logic_list_html = "".join(
+        f"<li>{_escape(note)}</li>"
+        for note in EXCLUSION_HELP_CONTENT["logic_notes"]
+    )
+    return (
+        f"<p>{_escape(EXCLUSION_HELP_CONTENT['intro'])}</p>"
+        "<h4>Wildcard (glob) examples</h4>"
+        f"<ul>{glob_list_html}</ul>"
+        "<h4>Regular expression examples</h4>"
+        f"<ul>{regex_list_html}</ul>"
+        "<h4>How exclusions interact with rule logic</h4>"
+        f"<ul>{logic_list_html}</ul>"
+        "<p><a href='learn_more_exclusions'>Learn more in the README</a></p>"
+    )
+
+
+# EXCLUSION_HELP_CONTENT is static, so escape and compose the dialog HTML
+# once at import instead of on every help-button click.
+_EXCLUSION_HELP_HTML = _build_exclusion_help_html()
+
+# Worker messages carry a short fixed prefix; the longest is "WARNING:"
+# (8 chars), so severity is a single dict lookup on the token before the
+# colon within a bounded head slice.
+LOG_TOKEN_SEVERITY = {
+    "ERROR": "ERROR",
+    "WARNING": "WARNING",
+    "WARN": "WARNING",
+    "STATUS": "INFO",
+}
+# Rule-summary sentence templates, prebuilt so the per-keystroke summary
+# rebuild is a dict lookup plus one format call instead of a branch cascade.
+# Condition templates are keyed by (has_age, has_pattern, logic_is_and);
+# action templates by (action_value, has_destination).
+SUMMARY_CONDITION_TEMPLATES = {
+    (True, True, True): "Files that are {age} and {pattern}",
+    (True, True, False): "Files that are {age} or {pattern}",
+    (True, False, True): "Files that are {age}",
+    (True, False, False): "Files that are {age}",
+    (False, True, True): "Files {pattern}",
+    (False, True, False): "Files {pattern}",
+    (False, False, True): "All files",
+    (False, False, False): "All files",
+}
+SUMMARY_ACTION_TEMPLATES = {
+    ("move", True): "will be moved to “{dest}”.",
+    ("move", False): "will be moved using the default destination.",
+    ("copy", True): "will be copied to “{dest}”.",
+    ("copy", False): "will be copied using the default destination.",
+    ("delete_to_trash", True): "will be sent to the recycle bin.",
+    ("delete_to_trash", False): "will be sent to the recycle bin.",
+    ("delete_permanently", True): "will be permanently deleted.",
+    ("delete_permanently", False): "will be permanently deleted.",
+}
 logger = logging.getLogger(__name__)
 
 
@@ -168,27 +303,224 @@ ACTION_COLOR_MAP = {
     "delete_permanently": "#F44336",
 }
 
+# Allowed notification categories per configured level; None (absent key,
+# i.e. the "All" level) allows every category.
+NOTIFICATION_LEVEL_CATEGORIES = {
+    NOTIFICATION_LEVEL_NONE: frozenset(),
+    NOTIFICATION_LEVEL_ERROR: frozenset({"error"}),
+    NOTIFICATION_LEVEL_SUMMARY: frozenset({"summary", "error"}),
+}
+
+# Sentinel marking the per-window notification filter as not yet computed.
+_NOTIFICATION_FILTER_UNSET = object()
+
+# Canonical worker_status values mapped straight to an indicator category;
+# free-form strings (e.g. error details) fall back to a substring scan.
+STATUS_INDICATOR_KEYS = {
+    "Running": "run",
+    "Dry Run Active": "dry",
+    "Stopping...": "stop",
+    "Stopped": "stop",
+    "Stopped (Unexpectedly)": "stop",
+}
+
+# Status-indicator stylesheets prebuilt per status category so the steady
+# state never re-invokes Qt's CSS parser.
+INDICATOR_STYLES = {
+    "error": "background-color: #dc3545; border-radius: 6px; border: 1px solid rgba(0, 0, 0, 0.2);",
+    "dry": "background-color: #0d6efd; border-radius: 6px; border: 1px solid rgba(0, 0, 0, 0.2);",
+    "run": "background-color: #28a745; border-radius: 6px; border: 1px solid rgba(0, 0, 0, 0.2);",
+    "stop": "background-color: #6c757d; border-radius: 6px; border: 1px solid rgba(0, 0, 0, 0.2);",
+}
+
+class _NullWidget:
+    """No-op stand-in for optional widgets that may not be constructed.
+
+    Installed as the class-level default for widgets like the preview
+    button so hot paths can call setEnabled/setText/setStyleSheet
+    unconditionally instead of probing with getattr/hasattr.
+    """
+
+    def _noop(self, *_args, **_kwargs):
+        return None
+
+    setEnabled = _noop
+    setText = _noop
+    setStyleSheet = _noop
+
+
+class _PreviewSignals(QObject):
+    """Signal holder for _PreviewScanTask (QRunnable cannot carry signals)."""
+
+    finished = pyqtSignal(list, object)  # (matches, exception or None)
+
+
+class _PreviewScanTask(QRunnable):
+    """Run get_preview_matches on a pool thread and report back via a signal."""
+
+    def __init__(self, folder_path: Path, age_days: int, pattern: str,
+                 use_regex: bool, rule_logic: str):
+        super().__init__()
+        self.signals = _PreviewSignals()
+        self._args = (folder_path, age_days, pattern, use_regex, rule_logic)
+
+    def run(self):
+        try:
+            matches = get_preview_matches(*self._args)
+        except Exception as exc:  # Reported to the GUI thread, not raised here
+            self.signals.finished.emit([], exc)
+            return
+        self.signals.finished.emit(list(matches), None)
+
+
 class ConfigWindow(QWidget):
     """Main configuration window for AutoTidy."""
 
+    # Class-level default so windows assembled piecewise (e.g. in tests)
+    # behave as fully built; __init__ flips it off until the first show.
+    _ui_ready = True
+
+    # Debounce state for rule saves; None means "commit synchronously".
+    _save_timer = None
+    _pending_save_path = None
+
+    # Debounce timer for live summary refreshes; None means "refresh inline".
+    _summary_timer = None
+
+    # Last rendered rule-summary state; lets repeated refreshes no-op.
+    _last_summary_state = None
+
+    # Per-severity QTextCharFormat table; built with the UI, None until then.
+    _log_formats = None
+
+    # Last placeholder visibility applied; None until first computed.
+    _last_placeholder_state = None
+
+    # In-flight preview scan; keeps the task's signal holder alive.
+    _preview_task = None
+    _preview_folder = None
+
+    # Last applied status-indicator style key and label text; the periodic
+    # status refresh skips widgets whose state did not change.
+    _last_indicator_key = None
+    _last_status_text = None
+    _last_status_summary_state = None
+
+    # Notification-category filter derived from the configured level;
+    # computed lazily and invalidated when settings change.
+    _allowed_categories = _NOTIFICATION_FILTER_UNSET
+
+    # Bound AutoTidyApp.show_system_notification, resolved on first use so
+    # each notification avoids the QApplication.instance()/getattr dance.
+    _notify_fn = None
+
+    # Whether the config changed since the last save; closeEvent skips its
+    # flush when clean. Defaults to True so piecewise-built windows (tests)
+    # keep the conservative save-on-close behaviour.
+    _config_dirty = True
+
+    # Rule-template QMenu, built once on first use; RULE_TEMPLATES is static.
+    _template_menu = None
+
+    # Set when log entries arrive while the window is hidden; showEvent
+    # rebuilds the view once instead of laying out unseen appends.
+    _log_view_stale = False
+
+    # Cached log_view scroll bar; resolved on first scroll-to-bottom.
+    _log_scrollbar = None
+
+    # Non-modal dialog state: references keep the open dialog alive, and
+    # the pending path carries the removal target to its callback.
+    _add_folder_dialog = None
+    _remove_confirm_box = None
+    _pending_remove_path = None
+
+    # Settings dialog, created on first open and reused afterwards.
+    _settings_dialog = None
+
+    # Cached dry-run flag; dry run only changes through the settings
+    # dialog, so the cache is dropped when that dialog closes. None means
+    # unset (False is a valid cached value).
+    _dry_run_cache = None
+
+    # Optional widgets default to shared no-op stand-ins so hot paths can
+    # drive them without getattr/hasattr probes; _init_ui installs the
+    # real widgets over these.
+    preview_rule_button = _NullWidget()
+    status_indicator = _NullWidget()
+    status_label = _NullWidget()
+    status_summary_label = _NullWidget()
+
+    # Shortcut sequences parsed once at class definition; QKeySequence is an
+    # immutable value type, so sharing across windows is safe.
+    _SHORTCUT_ADD_FOLDER = QKeySequence("Ctrl+O")
+    _SHORTCUT_HISTORY = QKeySequence("Ctrl+H")
+    _SHORTCUT_SETTINGS = QKeySequence("Ctrl+,")
+    _SHORTCUT_START = QKeySequence("Ctrl+S")
+    _SHORTCUT_STOP = QKeySequence("Ctrl+T")
+    _SHORTCUT_CLOSE = QKeySequence(Qt.Key.Key_Escape)
+
     def __init__(self, config_manager: ConfigManager, log_queue: queue.Queue):
         super().__init__()
         self.config_manager = config_manager
         self.log_queue = log_queue
-        self.undo_manager = UndoManager(self.config_manager) # Instantiate UndoManager
+        self.undo_manager = None # Created on first open_undo_dialog
         self.monitoring_worker: MonitoringWorker | None = None
         self.worker_status = "Stopped" # Track worker status
-        self._log_entries: list[tuple[datetime, str, str]] = []
+        self._log_entries: deque[tuple[datetime, str, str]] = deque(maxlen=MAX_LOG_ENTRIES)
+        self._active_log_filter = "ALL"
         self._action_chip_cache: dict[str, QPixmap | None] = {}
+        self._folder_name_cache: dict[str, str] = {}
+        self._rule_cache: dict[str, dict] = {}
+        # Mirrors the exclusion list widget; duplicate checks stay O(1)
+        # instead of enumerating items through Qt per add.
+        self._exclusion_set: set[str] = set()
+        # Path -> list item index kept in step with the folder list widget,
+        # so lookups avoid walking the list through Qt item by item.
+        self._folder_items: dict[str, QListWidgetItem] = {}
         self._supports_action_pixmaps = hasattr(QPixmap, "fill") and callable(getattr(QPixmap, "fill", None))
+        # Resolved once: cwd-independent, unlike the old per-click abspath().
+        self._readme_url = QUrl.fromLocalFile(str(Path(__file__).resolve().with_name("README.md")))
+        # Nothing edited yet; view-only sessions skip the close-time save.
+        self._config_dirty = False
 
         self.setWindowTitle("AutoTidy Configuration")
         self.setGeometry(200, 200, 600, 450) # x, y, width, height
 
+        # The window is created at application start but normally lives
+        # hidden in the tray, so the widget tree is only built on first show
+        # (see _ensure_ui_ready). Until then the log timer keeps draining the
+        # queue into _log_entries so nothing is lost.
+        self._ui_ready = False
+
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(RULE_SAVE_DEBOUNCE_MS)
+        self._save_timer.timeout.connect(self._commit_rule_changes)
+
+        self._summary_timer = QTimer(self)
+        self._summary_timer.setSingleShot(True)
+        self._summary_timer.setInterval(SUMMARY_REFRESH_DEBOUNCE_MS)
+        self._summary_timer.timeout.connect(self._update_rule_summary)
+
+        self._setup_log_timer()
+
+    def _ensure_ui_ready(self):
+        """Build the widget tree and load config on first use."""
+        if self._ui_ready:
+            return
+        self._ui_ready = True
         self._init_ui()
         self._load_initial_config()
-        self._setup_log_timer()
-        self._setup_shortcuts() # Call new method
+        self._setup_shortcuts()
+        if self._log_entries:
+            self._refresh_log_view()
+
+    def showEvent(self, event):
+        self._ensure_ui_ready()
+        if self._log_view_stale:
+            self._refresh_log_view()
+        super().showEvent(event)
 
     def _init_ui(self):
         """Initialize UI elements and layout."""
@@ -250,13 +582,12 @@ class ConfigWindow(QWidget):
         main_layout.addLayout(top_controls_layout)
 
         # --- Folder and Rule Area ---
+        # A plain layout with a setVisible toggle on the rule details; the
+        # old StackAll overlay cost an extra transparent paint pass and
+        # raise_() Z-order churn on every selection change.
         self.rule_area_container = QWidget()
-        self.rule_area_layout = QStackedLayout(self.rule_area_container)
+        self.rule_area_layout = QVBoxLayout(self.rule_area_container)
         self.rule_area_layout.setContentsMargins(0, 0, 0, 0)
-        try:
-            self.rule_area_layout.setStackingMode(QStackedLayout.StackingMode.StackAll)
-        except AttributeError:
-            pass  # Some Qt stubs may not expose stacking mode
 
         self.rule_controls_widget = QWidget()
         rule_controls_layout = QVBoxLayout(self.rule_controls_widget)
@@ -276,14 +607,26 @@ class ConfigWindow(QWidget):
             self.folder_search_edit.textChanged.connect(self._filter_folder_list)
         rule_controls_layout.addWidget(self.folder_search_edit)
         self.folder_list_widget = QListWidget()
+        # QListWidget is a QListView convenience subclass; declaring uniform
+        # item sizes lets the view skip per-item measurement so layout and
+        # paint cost track the visible rows, not the total folder count.
+        if hasattr(self.folder_list_widget, "setUniformItemSizes"):
+            self.folder_list_widget.setUniformItemSizes(True)
         rule_controls_layout.addWidget(self.folder_list_widget)
 
         rule_controls_layout.addWidget(QLabel("Rules for selected folder:"))
 
+        # Everything below the folder list lives in rule_detail_widget so the
+        # placeholder can swap in for it while the list stays interactive.
+        self.rule_detail_widget = QWidget()
+        rule_detail_layout = QVBoxLayout(self.rule_detail_widget)
+        rule_detail_layout.setContentsMargins(0, 0, 0, 0)
+        rule_detail_layout.setSpacing(6)
+
         self.rule_summary_label = QLabel("Select a monitored folder to see its rule.")
         self.rule_summary_label.setStyleSheet("color: #6c757d; font-style: italic;")
         self.rule_summary_label.setWordWrap(True)
-        rule_controls_layout.addWidget(self.rule_summary_label)
+        rule_detail_layout.addWidget(self.rule_summary_label)
 
         rule_groups_layout = QHBoxLayout()
 
@@ -322,7 +665,7 @@ class ConfigWindow(QWidget):
         action_group.setLayout(action_form)
 
         self.actionComboBox = QComboBox()
-        self.actionComboBox.addItems(["Move", "Copy", "Delete to Trash", "Delete Permanently"])
+        self.actionComboBox.addItems(list(ACTION_VALUE_TO_TEXT.values()))
         self.actionComboBox.setEnabled(False)
         self.actionComboBox.setToolTip("Action to perform on matching files.")
         action_form.addRow("Action:", self.actionComboBox)
@@ -387,7 +730,7 @@ class ConfigWindow(QWidget):
 
         rule_groups_layout.addWidget(match_group)
         rule_groups_layout.addWidget(action_group)
-        rule_controls_layout.addLayout(rule_groups_layout)
+        rule_detail_layout.addLayout(rule_groups_layout)
 
         # --- Exclusion Rules Editor ---
         exclusion_layout = QHBoxLayout()
@@ -414,18 +757,10 @@ class ConfigWindow(QWidget):
         exclusion_editor_layout.addLayout(exclusion_buttons_layout)
 
         exclusion_layout.addLayout(exclusion_editor_layout)
-        rule_controls_layout.addLayout(exclusion_layout)
+        rule_detail_layout.addLayout(exclusion_layout)
 
-        self.rule_area_layout.addWidget(self.rule_controls_widget)
+        rule_controls_layout.addWidget(self.rule_detail_widget)
 
-        placeholder_wrapper = QWidget()
-        try:
-            placeholder_wrapper.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
-        except AttributeError:
-            pass
-        placeholder_layout = QVBoxLayout(placeholder_wrapper)
-        placeholder_layout.setContentsMargins(24, 24, 24, 24)
-        placeholder_layout.addStretch()
         self.rule_placeholder_label = QLabel(
             (
                 "<b>The rule controls snooze until a folder is selected.</b><br/>"
@@ -439,15 +774,10 @@ class ConfigWindow(QWidget):
             "color: #495057; background-color: rgba(255, 255, 255, 232); border: 1px dashed #ced4da; "
             "border-radius: 8px; padding: 24px;"
         )
-        try:
-            self.rule_placeholder_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
-        except AttributeError:
-            pass
-        placeholder_layout.addWidget(self.rule_placeholder_label, 0, placeholder_alignment)
-        placeholder_layout.addStretch()
-        self.rule_area_layout.addWidget(placeholder_wrapper)
-        self._placeholder_overlay = placeholder_wrapper
-        self._placeholder_overlay.hide()
+        self.rule_placeholder_label.hide()
+        rule_controls_layout.addWidget(self.rule_placeholder_label)
+
+        self.rule_area_layout.addWidget(self.rule_controls_widget)
 
         main_layout.addWidget(self.rule_area_container)
 
@@ -547,8 +877,18 @@ class ConfigWindow(QWidget):
 
         logs_layout.addLayout(log_header_layout)
 
-        self.log_view = QTextEdit()
+        # QPlainTextEdit lays out plain text blocks instead of a rich-text
+        # document, which keeps appends cheap under heavy log traffic.
+        self.log_view = QPlainTextEdit()
         self.log_view.setReadOnly(True)
+        self.log_view.setToolTip(
+            f"Only the most recent {MAX_LOG_ENTRIES} log entries are kept; older ones are dropped."
+        )
+        # Cap the widget to the same retention as _log_entries so it trims
+        # old blocks itself instead of growing without bound.
+        if hasattr(self.log_view, "setMaximumBlockCount"):
+            self.log_view.setMaximumBlockCount(MAX_LOG_ENTRIES)
+        self._log_formats = self._build_log_formats()
         logs_layout.addWidget(self.log_view)
 
         log_actions_layout = QHBoxLayout()
@@ -568,16 +908,35 @@ class ConfigWindow(QWidget):
 
         main_layout.addWidget(logs_container)
 
+        # Widgets enabled/disabled together when the folder selection changes.
+        # The enabled checkbox (paired with its hint label) and the preview
+        # button have their own handling in _set_rule_widgets_enabled.
+        self._rule_widgets = (
+            self.age_spinbox,
+            self.pattern_lineedit,
+            self.rule_logic_combo,
+            self.useRegexCheckbox,
+            self.actionComboBox,
+            self.destination_lineedit,
+            self.destination_browse_button,
+            self.exclusion_list_widget,
+            self.add_exclusion_button,
+            self.remove_exclusion_button,
+            self.exclusion_help_button,
+        )
+
         # --- Connect Signals ---
         self.add_folder_button.clicked.connect(self.add_folder)
         self.remove_folder_button.clicked.connect(self.remove_folder)
         self.folder_list_widget.currentItemChanged.connect(self.update_rule_inputs)
         self.age_spinbox.valueChanged.connect(self.save_rule_changes)
         self.pattern_lineedit.editingFinished.connect(self.save_rule_changes) # Save when focus lost or Enter pressed
+        self.pattern_lineedit.textChanged.connect(self._schedule_summary_refresh)
         self.useRegexCheckbox.stateChanged.connect(self.save_rule_changes) # Connect checkbox
         self.rule_logic_combo.currentIndexChanged.connect(self.save_rule_changes) # Connect new combo box
         self.actionComboBox.currentIndexChanged.connect(self.save_rule_changes) # Connect action combo box
         self.destination_lineedit.editingFinished.connect(self.save_rule_changes)
+        self.destination_lineedit.textChanged.connect(self._schedule_summary_refresh)
         self.destination_browse_button.clicked.connect(self.browse_destination_folder)
         self.enabledCheckbox.stateChanged.connect(self.save_rule_changes)
         # self.apply_template_button.clicked.connect(self.apply_template) # Will be handled by QMenu
@@ -628,7 +987,9 @@ class ConfigWindow(QWidget):
     @pyqtSlot()
     def export_logs(self):
         """Export all stored logs to a file."""
-        default_name = f"autotidy-logs-{datetime.now().strftime('%Y%m%d-%H%M%S')}.txt"
+        # time.strftime formats the current local time without building an
+        # intermediate datetime object.
+        default_name = time.strftime("autotidy-logs-%Y%m%d-%H%M%S.txt")
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "Save Logs",
@@ -639,17 +1000,23 @@ class ConfigWindow(QWidget):
             return
 
         try:
+            # Join in memory (the deque is bounded) and write once instead of
+            # issuing one buffered write per entry.
+            body = "\n".join(
+                f"{timestamp.strftime('%Y-%m-%d %H:%M:%S')}\t{severity}\t{self._strip_message_prefix(severity, message)}"
+                for timestamp, severity, message in self._log_entries
+            )
             with open(file_path, "w", encoding="utf-8") as handle:
-                for timestamp, severity, message in self._log_entries:
-                    handle.write(
-                        f"{timestamp.strftime('%Y-%m-%d %H:%M:%S')}\t{severity.upper()}\t{self._strip_message_prefix(severity, message)}\n"
-                    )
+                if body:
+                    handle.write(body)
+                    handle.write("\n")
         except OSError as exc:
             QMessageBox.critical(self, "Save Logs", f"Could not save logs to '{file_path}': {exc}")
 
     @pyqtSlot(str)
     def _on_log_filter_changed(self, _text: str):
         """Refresh the log view when the filter changes."""
+        self._active_log_filter = (_text or "All").upper()
         self._refresh_log_view()
 
     @pyqtSlot(str)
@@ -659,45 +1026,123 @@ class ConfigWindow(QWidget):
 
     def _refresh_log_view(self):
         """Rebuild the visible log view based on the current filter."""
-        self.log_view.clear()
+        self._log_view_stale = False
         keyword = ""
         if hasattr(self, "log_search_edit") and hasattr(self.log_search_edit, "text"):
             keyword = (self.log_search_edit.text() or "").strip().lower()
-        for timestamp, severity, message in self._log_entries:
-            if not self._log_filter_allows(severity):
+
+        visible = []
+        for entry in self._log_entries:
+            if not self._log_filter_allows(entry[1]):
                 continue
-            search_target = f"{severity} {message}".lower()
+            search_target = f"{entry[1]} {entry[2]}".lower()
             if keyword and keyword not in search_target:
                 continue
-            self.log_view.append(self._format_log_message(timestamp, severity, message))
+            visible.append(entry)
+
+        # Clear and re-insert in one edit block instead of one append (and
+        # one relayout) per entry.
+        self.log_view.clear()
+        if not self._insert_log_entries(visible):
+            for timestamp, severity, message in visible:
+                self.log_view.append(self._format_log_message(timestamp, severity, message))
         self._scroll_log_to_bottom()
 
-    def _append_log_entry(self, severity: str, message: str):
-        """Store and append a log entry respecting the active filter."""
-        timestamp = datetime.now()
-        entry = (timestamp, severity, message)
+    def _record_log_entry(self, severity: str, message: str) -> tuple[datetime, str, str]:
+        """Normalise and store a log entry, returning the stored tuple."""
+        entry = (datetime.now(), severity.upper(), message)
         self._log_entries.append(entry)
-        if self._log_filter_allows(severity):
-            keyword = ""
-            if hasattr(self, "log_search_edit") and hasattr(self.log_search_edit, "text"):
-                keyword = (self.log_search_edit.text() or "").strip().lower()
-            search_target = f"{severity} {message}".lower()
-            if not keyword or keyword in search_target:
+        return entry
+
+    def _append_log_entry(self, severity: str, message: str):
+        """Store and render a single log entry respecting the active filter."""
+        self._render_log_entries([self._record_log_entry(severity, message)])
+
+    def _build_log_formats(self) -> dict:
+        """Pre-build one QTextCharFormat per severity for plain-text inserts."""
+        try:
+            formats = {"INFO": QTextCharFormat()}
+            for severity, color_name in (("ERROR", "red"), ("WARNING", "orange")):
+                fmt = QTextCharFormat()
+                fmt.setForeground(QBrush(QColor(color_name)))
+                formats[severity] = fmt
+            return formats
+        except Exception:  # Stubbed Qt without QTextCharFormat support
+            return {}
+
+    def _render_log_entries(self, entries: list[tuple[datetime, str, str]]):
+        """Append a batch of stored entries to the log view in one update."""
+        if not self._ui_ready or not entries:
+            return
+        # Rich-text layout for a hidden window is wasted work; the entries
+        # already live in _log_entries and showEvent rebuilds the view once.
+        is_visible = getattr(self, "isVisible", None)
+        if callable(is_visible) and not is_visible():
+            self._log_view_stale = True
+            return
+        keyword = ""
+        if hasattr(self, "log_search_edit") and hasattr(self.log_search_edit, "text"):
+            keyword = (self.log_search_edit.text() or "").strip().lower()
+
+        visible = [
+            entry
+            for entry in entries
+            if self._log_filter_allows(entry[1])
+            and (not keyword or keyword in f"{entry[1]} {entry[2]}".lower())
+        ]
+        if not visible:
+            return
+
+        if not self._insert_log_entries(visible):
+            for timestamp, severity, message in visible:
                 self.log_view.append(self._format_log_message(timestamp, severity, message))
-            self._scroll_log_to_bottom()
+        self._scroll_log_to_bottom()
+
+    def _insert_log_entries(self, visible: list[tuple[datetime, str, str]]) -> bool:
+        """Cursor-insert entries with precomputed formats; False if unsupported.
+
+        Cursor inserts with per-severity character formats skip any HTML
+        parsing, and the edit block collapses the batch into one document
+        change. Stubbed log views without a text cursor report False so
+        callers can fall back to plain append().
+        """
+        view = self.log_view
+        formats = self._log_formats
+        if not formats or not hasattr(view, "textCursor") or not hasattr(QTextCursor, "MoveOperation"):
+            return False
+        if hasattr(view, "setUpdatesEnabled"):
+            view.setUpdatesEnabled(False)
+        cursor = view.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.beginEditBlock()
+        try:
+            default_format = formats.get("INFO")
+            for timestamp, severity, message in visible:
+                cursor.insertText(
+                    self._format_log_line(timestamp, severity, message) + "\n",
+                    formats.get(severity, default_format),
+                )
+        finally:
+            cursor.endEditBlock()
+            if hasattr(view, "setUpdatesEnabled"):
+                view.setUpdatesEnabled(True)
+        return True
 
     def _log_filter_allows(self, severity: str) -> bool:
-        selected = (self.log_filter_combo.currentText() or "All").upper()
-        return selected == "ALL" or selected == severity.upper()
+        # Severities are normalised to uppercase on append, so a plain
+        # comparison against the cached filter text suffices.
+        return self._active_log_filter == "ALL" or self._active_log_filter == severity
 
-    def _format_log_message(self, timestamp: datetime, severity: str, message: str) -> str:
+    def _format_log_line(self, timestamp: datetime, severity: str, message: str) -> str:
+        """Plain-text rendering of a log entry (colour comes from char formats)."""
         ts_text = timestamp.strftime("%Y-%m-%d %H:%M:%S")
-        upper_severity = severity.upper()
-        clean_message = self._strip_message_prefix(upper_severity, message)
-        formatted = f"[{ts_text}] {upper_severity} {clean_message}"
-        if upper_severity == "ERROR":
+        return f"[{ts_text}] {severity} {self._strip_message_prefix(severity, message)}"
+
+    def _format_log_message(self, timestamp: datetime, severity: str, message: str) -> str:
+        formatted = self._format_log_line(timestamp, severity, message)
+        if severity == "ERROR":
             return f'<font color="red">{formatted}</font>'
-        if upper_severity == "WARNING":
+        if severity == "WARNING":
             return f'<font color="orange">{formatted}</font>'
         return formatted
 
@@ -708,40 +1153,43 @@ class ConfigWindow(QWidget):
         return message
 
     def _scroll_log_to_bottom(self):
-        scroll_bar = getattr(self.log_view, "verticalScrollBar", None)
-        if callable(scroll_bar):
-            scroll_obj = scroll_bar()
-        else:
-            scroll_obj = None
+        # The scroll bar handle is stable for the lifetime of log_view, so
+        # resolve it once instead of walking the widget tree per batch.
+        scroll_obj = self._log_scrollbar
+        if scroll_obj is None:
+            scroll_bar = getattr(self.log_view, "verticalScrollBar", None)
+            if callable(scroll_bar):
+                scroll_obj = scroll_bar()
+                self._log_scrollbar = scroll_obj
 
         if scroll_obj is not None:
             scroll_obj.setValue(scroll_obj.maximum())
 
     def _determine_log_severity(self, message: str) -> str:
-        normalized = message.strip().upper()
-        if normalized.startswith("ERROR:"):
-            return "ERROR"
-        if normalized.startswith("WARNING:") or normalized.startswith("WARN:"):
-            return "WARNING"
-        if normalized.startswith("STATUS:"):
-            return "INFO"
+        # Uppercase only a bounded head slice rather than the whole message;
+        # this runs for every queued log line.
+        head = message.lstrip()[:8].upper()
+        colon = head.find(":")
+        if colon > 0:
+            return LOG_TOKEN_SEVERITY.get(head[:colon], "INFO")
         return "INFO"
 
     def _setup_shortcuts(self):
         """Setup keyboard shortcuts for common actions."""
-        self.add_folder_button.setShortcut(QKeySequence("Ctrl+O"))
+        self.add_folder_button.setShortcut(self._SHORTCUT_ADD_FOLDER)
         # Remove folder shortcut handled by keyPressEvent on list widget
-        self.view_history_button.setShortcut(QKeySequence("Ctrl+H"))
-        self.settings_button.setShortcut(QKeySequence("Ctrl+,")) # Comma for settings often
-        self.start_button.setShortcut(QKeySequence("Ctrl+S"))
-        self.stop_button.setShortcut(QKeySequence("Ctrl+T"))
+        self.view_history_button.setShortcut(self._SHORTCUT_HISTORY)
+        self.settings_button.setShortcut(self._SHORTCUT_SETTINGS) # Comma for settings often
+        self.start_button.setShortcut(self._SHORTCUT_START)
+        self.stop_button.setShortcut(self._SHORTCUT_STOP)
 
         # Shortcut for closing/hiding the window
-        close_shortcut = QKeySequence(Qt.Key.Key_Escape)
-        self.addAction(self.create_action("Hide Window", self.close, close_shortcut))
+        self.addAction(self.create_action("Hide Window", self.close, self._SHORTCUT_CLOSE))
 
     def _apply_instruction_visibility(self):
         """Show or hide the quick start instructions based on saved preference."""
+        if self.instructions_container is None:
+            return  # Already destroyed after a permanent dismissal.
         should_show = not self.config_manager.get_setting("hide_instructions", False)
         self.instructions_container.setVisible(should_show)
 
@@ -774,6 +1222,13 @@ class ConfigWindow(QWidget):
         """Locate the list widget item that represents the provided folder path."""
         if not path:
             return None
+        folder_items = getattr(self, "_folder_items", None)
+        if folder_items is not None:
+            item = folder_items.get(path)
+            if item is not None:
+                return item
+        # Fallback scan for windows assembled without the index (tests) or
+        # items added outside the tracked paths.
         for index in range(self.folder_list_widget.count()):
             item = self.folder_list_widget.item(index)
             if item and self._get_item_path(item) == path:
@@ -818,7 +1273,7 @@ class ConfigWindow(QWidget):
             return ""
         rule = rule or {}
         action_value = rule.get("action", "move")
-        action_label = ACTION_VALUE_TO_TEXT.get(action_value, action_value.title())
+        action_label = _action_value_to_text(action_value, action_value.title())
         enabled = rule.get("enabled", True)
         status_label = "Enabled" if enabled else "Disabled"
         return f"{path} — {action_label} ({status_label})"
@@ -829,15 +1284,15 @@ class ConfigWindow(QWidget):
             return ""
         rule = rule or {}
         action_value = rule.get("action", "move")
-        action_label = ACTION_VALUE_TO_TEXT.get(action_value, action_value.title())
+        action_label = _action_value_to_text(action_value, action_value.title())
         enabled = rule.get("enabled", True)
         destination = rule.get("destination_folder", "")
 
-        tooltip_lines = [f"<b>{html.escape(path)}</b>"]
-        tooltip_lines.append(html.escape(f"Action: {action_label}"))
-        tooltip_lines.append(html.escape(f"Status: {'Enabled' if enabled else 'Disabled'}"))
+        tooltip_lines = [f"<b>{_escape(path)}</b>"]
+        tooltip_lines.append(_escape(f"Action: {action_label}"))
+        tooltip_lines.append(_escape(f"Status: {'Enabled' if enabled else 'Disabled'}"))
         if destination:
-            tooltip_lines.append(html.escape(f"Destination: {destination}"))
+            tooltip_lines.append(_escape(f"Destination: {destination}"))
         return "<br/>".join(tooltip_lines)
 
     def _apply_folder_item_style(self, item: QListWidgetItem, rule: dict | None) -> None:
@@ -878,6 +1333,25 @@ class ConfigWindow(QWidget):
         except Exception:
             pass
 
+    def _get_folder_rule_cached(self, path: str) -> dict | None:
+        """Fetch a folder's rule through the per-path cache.
+
+        get_folder_rule is a linear scan over the config list and several
+        UI paths ask for the same rule during one selection change.
+        It returns the live dict, so in-place updates keep cached entries
+        current; entries are dropped when a folder is removed and the cache
+        is cleared on full config reloads.
+        """
+        cache = getattr(self, "_rule_cache", None)
+        if cache is None:
+            return self.config_manager.get_folder_rule(path)
+        rule = cache.get(path)
+        if rule is None:
+            rule = self.config_manager.get_folder_rule(path)
+            if rule is not None:
+                cache[path] = rule
+        return rule
+
     def _refresh_folder_item_display(self, item: QListWidgetItem | None) -> None:
         """Synchronize the visible summary, tooltip, and styling for an item."""
         if item is None:
@@ -885,7 +1359,7 @@ class ConfigWindow(QWidget):
         path = self._get_item_path(item)
         if not path:
             return
-        rule = self.config_manager.get_folder_rule(path)
+        rule = self._get_folder_rule_cached(path)
         summary = self._build_folder_item_summary(path, rule)
         tooltip = self._build_folder_item_tooltip(path, rule)
         try:
@@ -926,10 +1400,16 @@ class ConfigWindow(QWidget):
         self._update_placeholder_visibility()
 
     def _update_placeholder_visibility(self):
-        """Toggle the placeholder overlay based on folder availability and selection."""
-        overlay = getattr(self, "_placeholder_overlay", None)
+        """Show either the rule detail controls or the placeholder hint."""
+        placeholder = getattr(self, "rule_placeholder_label", None)
+        detail_widget = getattr(self, "rule_detail_widget", None)
         list_widget = getattr(self, "folder_list_widget", None)
-        if overlay is None or list_widget is None or not hasattr(list_widget, "count"):
+        if (
+            placeholder is None
+            or detail_widget is None
+            or list_widget is None
+            or not hasattr(list_widget, "count")
+        ):
             return
 
         current_item = list_widget.currentItem() if hasattr(list_widget, "currentItem") else None
@@ -949,20 +1429,19 @@ class ConfigWindow(QWidget):
         has_items = visible_items > 0
         has_selection = has_visible_selection
         should_show = not has_items or not has_selection
-        overlay.setVisible(should_show)
-
-        # Ensure the visible widget is on top so the UI stays contextual.
-        # If the placeholder should be visible, raise it above the rule controls.
-        # Otherwise, bring the rule controls to the front so the folder list and inputs
-        # are fully visible (fixes the case where a semi-opaque overlay was drawn over controls).
-        try:
-            if should_show:
-                overlay.raise_()
-            else:
-                self.rule_controls_widget.raise_()
-        except Exception:
-            # Some Qt stubs used in tests may not implement raise_; ignore failures there.
-            pass
+        if should_show == self._last_placeholder_state:
+            return
+        self._last_placeholder_state = should_show
+        detail_widget.setVisible(not should_show)
+        placeholder.setVisible(should_show)
+
+    def _schedule_summary_refresh(self, *_args):
+        """Debounce live summary updates from textChanged signals."""
+        timer = self._summary_timer
+        if timer is None:
+            self._update_rule_summary()
+            return
+        timer.start()
 
     def _update_rule_summary(self):
         """Update the textual summary of the currently selected rule."""
@@ -972,32 +1451,24 @@ class ConfigWindow(QWidget):
 
         current_item = self.folder_list_widget.currentItem()
         if current_item is None:
-            summary_label.setText(html.escape("Select a monitored folder to see its rule."))
+            self._set_rule_summary_text(summary_label, "Select a monitored folder to see its rule.")
             return
 
         path = self._get_item_path(current_item)
         if not path:
-            summary_label.setText(html.escape("Select a monitored folder to see its rule."))
+            self._set_rule_summary_text(summary_label, "Select a monitored folder to see its rule.")
             return
-        stripped_path = path.rstrip("/\\")
-        if stripped_path:
-            folder_name_candidate = stripped_path.split("/")[-1]
-            if "\\" in folder_name_candidate:
-                folder_name_candidate = folder_name_candidate.split("\\")[-1]
-            folder_name = folder_name_candidate or stripped_path
-        else:
-            folder_name = path
-        folder_name = folder_name or path
+        folder_name = self._derive_folder_name(path)
 
-        rule = self.config_manager.get_folder_rule(path) if hasattr(self, "config_manager") else None
+        rule = self._get_folder_rule_cached(path) if hasattr(self, "config_manager") else None
         if rule is None:
             message = f"No saved rule found for {folder_name}."
-            summary_label.setText(html.escape(message))
+            self._set_rule_summary_text(summary_label, message, ("no-rule", path))
             return
 
         if not self.enabledCheckbox.isChecked():
             message = f"Rule for {folder_name} is disabled; matching files will be left untouched."
-            summary_label.setText(html.escape(message))
+            self._set_rule_summary_text(summary_label, message, ("disabled", path))
             return
 
         age_value = self.age_spinbox.value() if hasattr(self, "age_spinbox") else 0
@@ -1005,9 +1476,16 @@ class ConfigWindow(QWidget):
         use_regex = self.useRegexCheckbox.isChecked() if hasattr(self, "useRegexCheckbox") else False
         logic_value = (self.rule_logic_combo.currentText() if hasattr(self, "rule_logic_combo") else "OR").upper()
         action_text = self.actionComboBox.currentText() if hasattr(self, "actionComboBox") else "Move"
-        action_value = ACTION_TEXT_TO_VALUE.get(action_text, action_text.lower())
+        action_value = _action_text_to_value(action_text, action_text.lower())
         destination_text = self.destination_lineedit.text().strip() if hasattr(self, "destination_lineedit") else ""
 
+        state_key = (
+            path, age_value, pattern_raw, use_regex, logic_value, action_value,
+            action_text, destination_text,
+        )
+        if state_key == self._last_summary_state:
+            return  # Inputs unchanged; skip rebuilding and re-escaping the text.
+
         if age_value > 0:
             age_phrase = f"at least {age_value} day{'s' if age_value != 1 else ''} old"
         else:
@@ -1025,51 +1503,62 @@ class ConfigWindow(QWidget):
             else:
                 pattern_phrase = f"matching the pattern “{pattern_value}”"
 
-        if age_phrase and pattern_phrase:
-            connector = " and " if logic_value == "AND" else " or "
-            condition_sentence = f"Files that are {age_phrase}{connector}{pattern_phrase}"
-        elif age_phrase:
-            condition_sentence = f"Files that are {age_phrase}"
-        elif pattern_phrase:
-            condition_sentence = f"Files {pattern_phrase}"
-        else:
-            condition_sentence = "All files"
+        condition_key = (bool(age_phrase), bool(pattern_phrase), logic_value == "AND")
+        condition_sentence = SUMMARY_CONDITION_TEMPLATES[condition_key].format(
+            age=age_phrase, pattern=pattern_phrase
+        )
 
-        if action_value == "move":
-            if destination_text:
-                action_sentence = f"will be moved to “{destination_text}”."
-            else:
-                action_sentence = "will be moved using the default destination."
-        elif action_value == "copy":
-            if destination_text:
-                action_sentence = f"will be copied to “{destination_text}”."
-            else:
-                action_sentence = "will be copied using the default destination."
-        elif action_value == "delete_to_trash":
-            action_sentence = "will be sent to the recycle bin."
-        elif action_value == "delete_permanently":
-            action_sentence = "will be permanently deleted."
+        action_template = SUMMARY_ACTION_TEMPLATES.get((action_value, bool(destination_text)))
+        if action_template is not None:
+            action_sentence = action_template.format(dest=destination_text)
         else:
             action_sentence = f"will perform the “{action_text}” action."
 
         summary = f"{folder_name}: {condition_sentence} {action_sentence}"
-        summary_label.setText(html.escape(summary))
+        self._set_rule_summary_text(summary_label, summary, state_key)
+
+    def _set_rule_summary_text(self, summary_label, text: str, state_key=None):
+        """Render the summary label and remember which state produced it."""
+        self._last_summary_state = state_key
+        summary_label.setText(_escape(text))
+
+    def _derive_folder_name(self, path: str) -> str:
+        """Return the display name for a folder path, cached per path."""
+        cache = getattr(self, "_folder_name_cache", None)
+        if cache is not None:
+            cached = cache.get(path)
+            if cached is not None:
+                return cached
+        stripped_path = path.rstrip("/\\")
+        if stripped_path:
+            folder_name = stripped_path.split("/")[-1]
+            if "\\" in folder_name:
+                folder_name = folder_name.split("\\")[-1]
+            folder_name = folder_name or stripped_path
+        else:
+            folder_name = path
+        folder_name = folder_name or path
+        if cache is not None:
+            cache[path] = folder_name
+        return folder_name
 
     def _hide_instructions_permanently(self):
-        """Hide the instructions widget and remember the user's choice."""
+        """Destroy the instructions widget and remember the user's choice."""
         self.config_manager.set_setting("hide_instructions", True)
         self.config_manager.save_config()
-        self._apply_instruction_visibility()
+        # The dismissal is permanent, so drop the rich-text label and its
+        # container entirely instead of keeping a hidden widget in the tree.
+        if self.instructions_container is not None:
+            self.instructions_container.deleteLater()
+            self.instructions_container = None
 
     def _on_instruction_link_activated(self, link: str):
         """Handle help link clicks from the instructions area."""
         if link == "readme":
-            readme_path = os.path.abspath("README.md")
-            QDesktopServices.openUrl(QUrl.fromLocalFile(readme_path))
+            QDesktopServices.openUrl(self._readme_url)
 
     def create_action(self, text, slot, shortcut=None):
         """Helper to create a QAction for shortcuts not tied to a button."""
-        from PyQt6.QtGui import QAction # Local import
         action = QAction(text, self)
         action.triggered.connect(slot)
         if shortcut:
@@ -1093,15 +1582,31 @@ class ConfigWindow(QWidget):
     def _load_initial_config(self):
         """Load existing configuration into the UI."""
         # Config is now a dict, get folders list
+        self._rule_cache.clear()
         folders = self.config_manager.get_monitored_folders()
-        self.folder_list_widget.clear()
-        for item in folders:
-            path = item.get('path')
-            if path:
-                list_item = QListWidgetItem()
-                self._set_folder_item_path(list_item, path)
-                self._refresh_folder_item_display(list_item)
-                self.folder_list_widget.addItem(list_item)
+
+        # Populate in one visual batch: signals stay blocked so each addItem
+        # does not fire a currentItemChanged cascade, and repaints are held
+        # until the whole list is in place.
+        list_widget = self.folder_list_widget
+        blocker = QSignalBlocker(list_widget)
+        if hasattr(list_widget, "setUpdatesEnabled"):
+            list_widget.setUpdatesEnabled(False)
+        try:
+            list_widget.clear()
+            self._folder_items.clear()
+            for item in folders:
+                path = item.get('path')
+                if path:
+                    list_item = QListWidgetItem()
+                    self._set_folder_item_path(list_item, path)
+                    self._refresh_folder_item_display(list_item)
+                    list_widget.addItem(list_item)
+                    self._folder_items[path] = list_item
+        finally:
+            if hasattr(list_widget, "setUpdatesEnabled"):
+                list_widget.setUpdatesEnabled(True)
+            del blocker  # Re-enable signals before the selection below fires
 
         if self.folder_list_widget.count() > 0:
             self.folder_list_widget.setCurrentRow(0)
@@ -1119,17 +1624,39 @@ class ConfigWindow(QWidget):
         self.log_timer.timeout.connect(self.check_log_queue)
         self.log_timer.start(LOG_QUEUE_CHECK_INTERVAL_MS)
 
+    def _set_log_timer_interval(self, interval_ms: int):
+        """Retarget the log poll timer, avoiding redundant restarts."""
+        timer = getattr(self, "log_timer", None)
+        if timer is not None and timer.interval() != interval_ms:
+            timer.start(interval_ms)
+
     @pyqtSlot()
     def add_folder(self):
         """Open dialog to add a folder to monitor."""
-        dir_path = QFileDialog.getExistingDirectory(self, "Select Folder to Monitor")
+        # Non-modal picker: getExistingDirectory blocks the event loop, so
+        # log drains and status updates would stall while it is open. The
+        # dialog stays referenced until it reports back.
+        dialog = QFileDialog(self, "Select Folder to Monitor")
+        dialog.setFileMode(QFileDialog.FileMode.Directory)
+        dialog.setOption(QFileDialog.Option.ShowDirsOnly, True)
+        dialog.fileSelected.connect(self._on_add_folder_selected)
+        dialog.finished.connect(dialog.deleteLater)
+        self._add_folder_dialog = dialog
+        dialog.open()
+
+    @pyqtSlot(str)
+    def _on_add_folder_selected(self, dir_path: str):
+        """Add the folder chosen in the non-modal picker."""
+        self._add_folder_dialog = None
         if dir_path:
             # Use default rules initially
             if self.config_manager.add_folder(dir_path):
+                self._config_dirty = True
                 list_item = QListWidgetItem()
                 self._set_folder_item_path(list_item, dir_path)
                 self._refresh_folder_item_display(list_item)
                 self.folder_list_widget.addItem(list_item)
+                self._folder_items[dir_path] = list_item
                 self.folder_list_widget.setCurrentItem(list_item) # Select the new item
                 self.log_queue.put(f"INFO: Added folder: {dir_path}")
                 search_text = (
@@ -1151,53 +1678,81 @@ class ConfigWindow(QWidget):
             if not path:
                 QMessageBox.warning(self, "Missing Path", "The selected folder entry is missing its path information.")
                 return
-            reply = QMessageBox.question(self, "Confirm Removal",
-                                         f"Are you sure you want to stop monitoring '{path}'?",
-                                         QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                                         QMessageBox.StandardButton.No)
-            if reply == QMessageBox.StandardButton.Yes:
-                if self.config_manager.remove_folder(path):
-                    row = self.folder_list_widget.row(current_item)
-                    self.folder_list_widget.takeItem(row)
-                    self.log_queue.put(f"INFO: Removed folder: {path}")
-                    if self.folder_list_widget.count() > 0:
-                        new_row = min(row, self.folder_list_widget.count() - 1)
-                        self.folder_list_widget.setCurrentRow(new_row)
-                    # Clear/disable inputs if no item is selected
-                    if self.folder_list_widget.count() == 0:
-                         self.age_spinbox.setEnabled(False)
-                         self.pattern_lineedit.setEnabled(False)
-                         self.rule_logic_combo.setEnabled(False) # Disable logic combo
-                         self.useRegexCheckbox.setEnabled(False) # Disable regex checkbox
-                         self.actionComboBox.setEnabled(False) # Disable action combo box
-                         self._set_rule_toggle_enabled(False)
-                         self.age_spinbox.setValue(0)
-                         self.pattern_lineedit.clear()
-                         self.useRegexCheckbox.setChecked(False) # Uncheck regex checkbox
-                         self.rule_logic_combo.setCurrentIndex(0) # Reset logic combo
-                         self.actionComboBox.setCurrentIndex(0) # Reset action combo box
-                         self.enabledCheckbox.setChecked(False)
-                         self.exclusion_list_widget.clear() # Clear exclusions
-                         self.exclusion_list_widget.setEnabled(False)
-                         self.add_exclusion_button.setEnabled(False)
-                         self.remove_exclusion_button.setEnabled(False)
-                         self.exclusion_help_button.setEnabled(False) # Disable help button
-                         # Explicitly call update_rule_inputs with None when list is empty
-                         self.update_rule_inputs(None, None)
-                    search_text = (
-                        self.folder_search_edit.text()
-                        if hasattr(self, "folder_search_edit") and hasattr(self.folder_search_edit, "text")
-                        else ""
-                    )
-                    self._filter_folder_list(search_text)
-                else:
-                     QMessageBox.warning(self, "Error", f"Could not remove folder '{path}' from configuration.")
+            # Non-modal confirmation for the same reason as add_folder: the
+            # event loop keeps running while the question is up.
+            box = QMessageBox(self)
+            box.setIcon(QMessageBox.Icon.Question)
+            box.setWindowTitle("Confirm Removal")
+            box.setText(f"Are you sure you want to stop monitoring '{path}'?")
+            box.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+            box.setDefaultButton(QMessageBox.StandardButton.No)
+            box.buttonClicked.connect(self._on_remove_folder_choice)
+            box.finished.connect(box.deleteLater)
+            self._remove_confirm_box = box
+            self._pending_remove_path = path
+            box.open()
         else:
             QMessageBox.information(self, "No Selection", "Please select a folder to remove.")
 
+    def _on_remove_folder_choice(self, button):
+        """Complete a folder removal once the confirmation box reports back."""
+        box = self._remove_confirm_box
+        path = self._pending_remove_path
+        self._remove_confirm_box = None
+        self._pending_remove_path = None
+        if box is None or not path:
+            return
+        if box.standardButton(button) != QMessageBox.StandardButton.Yes:
+            return
+        current_item = self._find_folder_item_by_path(path)
+        if current_item is not None:
+            if self.config_manager.remove_folder(path):
+                self._config_dirty = True
+                self._rule_cache.pop(path, None)
+                self._folder_items.pop(path, None)
+                row = self.folder_list_widget.row(current_item)
+                self.folder_list_widget.takeItem(row)
+                self.log_queue.put(f"INFO: Removed folder: {path}")
+                if self.folder_list_widget.count() > 0:
+                    new_row = min(row, self.folder_list_widget.count() - 1)
+                    self.folder_list_widget.setCurrentRow(new_row)
+                # Clear/disable inputs if no item is selected
+                if self.folder_list_widget.count() == 0:
+                     self.age_spinbox.setEnabled(False)
+                     self.pattern_lineedit.setEnabled(False)
+                     self.rule_logic_combo.setEnabled(False) # Disable logic combo
+                     self.useRegexCheckbox.setEnabled(False) # Disable regex checkbox
+                     self.actionComboBox.setEnabled(False) # Disable action combo box
+                     self._set_rule_toggle_enabled(False)
+                     self.age_spinbox.setValue(0)
+                     self.pattern_lineedit.clear()
+                     self.useRegexCheckbox.setChecked(False) # Uncheck regex checkbox
+                     self.rule_logic_combo.setCurrentIndex(0) # Reset logic combo
+                     self.actionComboBox.setCurrentIndex(0) # Reset action combo box
+                     self.enabledCheckbox.setChecked(False)
+                     self.exclusion_list_widget.clear() # Clear exclusions
+                     self._exclusion_set.clear()
+                     self.exclusion_list_widget.setEnabled(False)
+                     self.add_exclusion_button.setEnabled(False)
+                     self.remove_exclusion_button.setEnabled(False)
+                     self.exclusion_help_button.setEnabled(False) # Disable help button
+                     # Explicitly call update_rule_inputs with None when list is empty
+                     self.update_rule_inputs(None, None)
+                search_text = (
+                    self.folder_search_edit.text()
+                    if hasattr(self, "folder_search_edit") and hasattr(self.folder_search_edit, "text")
+                    else ""
+                )
+                self._filter_folder_list(search_text)
+            else:
+                 QMessageBox.warning(self, "Error", f"Could not remove folder '{path}' from configuration.")
+
     @pyqtSlot(QListWidgetItem, QListWidgetItem)
     def update_rule_inputs(self, current: QListWidgetItem | None, previous: QListWidgetItem | None): # Allow None
         """Update rule input fields when folder selection changes."""
+        # Persist any debounced edit for the previous folder before the
+        # inputs below are overwritten with the new selection's rule.
+        self._flush_pending_rule_changes()
         self._update_placeholder_visibility()
         if previous is not None:
             self._refresh_folder_item_display(previous)
@@ -1207,17 +1762,23 @@ class ConfigWindow(QWidget):
                 self._refresh_folder_item_display(current)
                 rule = None
             else:
-                rule = self.config_manager.get_folder_rule(path)
+                rule = self._get_folder_rule_cached(path)
             if rule:
-                # Block signals temporarily to prevent save_rule_changes from firing
-                self.age_spinbox.blockSignals(True)
-                self.pattern_lineedit.blockSignals(True)
-                self.rule_logic_combo.blockSignals(True)
-                self.useRegexCheckbox.blockSignals(True)
-                self.actionComboBox.blockSignals(True) # Block actionComboBox signals
-                self.destination_lineedit.blockSignals(True)
-                self.enabledCheckbox.blockSignals(True)
-                self.exclusion_list_widget.blockSignals(True) # Block exclusion list signals
+                # RAII blockers keep save_rule_changes from firing while the
+                # inputs are loaded; they unblock when the list is dropped.
+                blockers = [
+                    QSignalBlocker(widget)
+                    for widget in (
+                        self.age_spinbox,
+                        self.pattern_lineedit,
+                        self.rule_logic_combo,
+                        self.useRegexCheckbox,
+                        self.actionComboBox,
+                        self.destination_lineedit,
+                        self.enabledCheckbox,
+                        self.exclusion_list_widget,
+                    )
+                ]
 
                 self.age_spinbox.setValue(rule.get('age_days', 0))
                 self.pattern_lineedit.setText(rule.get('pattern', '*.*'))
@@ -1237,90 +1798,49 @@ class ConfigWindow(QWidget):
                     item = QListWidgetItem(exclusion_pattern)
                     item.setFlags(item.flags() | Qt.ItemFlag.ItemIsEditable) # Make item editable
                     self.exclusion_list_widget.addItem(item)
+                self._exclusion_set = set(exclusions)
+
+                self._set_rule_widgets_enabled(True)
 
-                self.age_spinbox.setEnabled(True)
-                self.pattern_lineedit.setEnabled(True)
-                self.rule_logic_combo.setEnabled(True)
-                self.useRegexCheckbox.setEnabled(True) # Enable checkbox
-                self.actionComboBox.setEnabled(True) # Enable actionComboBox
-                self.destination_lineedit.setEnabled(True)
-                self.destination_browse_button.setEnabled(True)
-                self._set_rule_toggle_enabled(True)
-                preview_button = getattr(self, "preview_rule_button", None)
-                if preview_button is not None and hasattr(preview_button, "setEnabled"):
-                    preview_button.setEnabled(True)
-                self.exclusion_list_widget.setEnabled(True)
-                self.add_exclusion_button.setEnabled(True)
-                self.remove_exclusion_button.setEnabled(True)
-                self.exclusion_help_button.setEnabled(True) # Enable help button
-
-
-                self.age_spinbox.blockSignals(False)
-                self.pattern_lineedit.blockSignals(False)
-                self.rule_logic_combo.blockSignals(False)
-                self.useRegexCheckbox.blockSignals(False)
-                self.actionComboBox.blockSignals(False) # Unblock actionComboBox signals
-                self.destination_lineedit.blockSignals(False)
-                self.enabledCheckbox.blockSignals(False)
-                self.exclusion_list_widget.blockSignals(False) # Unblock exclusion list signals
+                del blockers  # Unblock all widgets together
                 self._update_destination_enabled_state(base_enabled=True)
             else:
                 # Should not happen if list is synced with config, but handle defensively
-                self.age_spinbox.setEnabled(False)
-                self.pattern_lineedit.setEnabled(False)
-                self.rule_logic_combo.setEnabled(False)
-                self.useRegexCheckbox.setEnabled(False) # Disable checkbox
-                self.actionComboBox.setEnabled(False) # Disable actionComboBox
-                self.destination_lineedit.setEnabled(False)
-                self.destination_browse_button.setEnabled(False)
-                self._set_rule_toggle_enabled(False)
-                preview_button = getattr(self, "preview_rule_button", None)
-                if preview_button is not None and hasattr(preview_button, "setEnabled"):
-                    preview_button.setEnabled(False)
-                self.age_spinbox.setValue(0)
-                self.pattern_lineedit.clear()
-                self.rule_logic_combo.setCurrentIndex(0)
-                self.useRegexCheckbox.setChecked(False) # Uncheck checkbox
-                self.actionComboBox.setCurrentIndex(0) # Reset actionComboBox
-                self.destination_lineedit.clear()
-                self.enabledCheckbox.setChecked(False)
-                self.exclusion_list_widget.clear() # Clear exclusions
-                self.exclusion_list_widget.setEnabled(False)
-                self.add_exclusion_button.setEnabled(False)
-                self.remove_exclusion_button.setEnabled(False)
-                self.exclusion_help_button.setEnabled(False) # Disable help button
-                self._update_destination_enabled_state(base_enabled=False)
+                self._reset_rule_inputs()
         else:
             # No item selected, disable all rule inputs
-            self.age_spinbox.setEnabled(False)
-            self.pattern_lineedit.setEnabled(False)
-            self.rule_logic_combo.setEnabled(False)
-            self.useRegexCheckbox.setEnabled(False) # Disable checkbox
-            self.actionComboBox.setEnabled(False) # Disable actionComboBox
-            self.destination_lineedit.setEnabled(False)
-            self.destination_browse_button.setEnabled(False)
-            self._set_rule_toggle_enabled(False)
-            preview_button = getattr(self, "preview_rule_button", None)
-            if preview_button is not None and hasattr(preview_button, "setEnabled"):
-                preview_button.setEnabled(False)
-            self.age_spinbox.setValue(0)
-            self.pattern_lineedit.clear()
-            self.rule_logic_combo.setCurrentIndex(0)
-            self.useRegexCheckbox.setChecked(False)
-            self.actionComboBox.setCurrentIndex(0) # Reset actionComboBox
-            self.destination_lineedit.clear()
-            self.enabledCheckbox.setChecked(False)
-            self.exclusion_list_widget.clear() # Clear exclusions
-            self.exclusion_list_widget.setEnabled(False)
-            self.add_exclusion_button.setEnabled(False)
-            self.remove_exclusion_button.setEnabled(False)
-            self.exclusion_help_button.setEnabled(False) # Disable help button
-            self._update_destination_enabled_state(base_enabled=False)
+            self._reset_rule_inputs()
         self._update_placeholder_visibility()
         if current is not None:
             self._refresh_folder_item_display(current)
         self._update_rule_summary()
 
+    def _set_rule_widgets_enabled(self, enabled: bool) -> None:
+        """Toggle the rule editing widgets, skipping no-op setEnabled calls.
+
+        setEnabled triggers a style recomputation and changeEvent dispatch
+        per widget, so widgets already in the target state are left alone.
+        """
+        for widget in self._rule_widgets:
+            if widget.isEnabled() != enabled:
+                widget.setEnabled(enabled)
+        self._set_rule_toggle_enabled(enabled)
+        self.preview_rule_button.setEnabled(enabled)
+
+    def _reset_rule_inputs(self) -> None:
+        """Disable the rule inputs and restore their default values."""
+        self._set_rule_widgets_enabled(False)
+        self.age_spinbox.setValue(0)
+        self.pattern_lineedit.clear()
+        self.rule_logic_combo.setCurrentIndex(0)
+        self.useRegexCheckbox.setChecked(False)
+        self.actionComboBox.setCurrentIndex(0)
+        self.destination_lineedit.clear()
+        self.enabledCheckbox.setChecked(False)
+        self.exclusion_list_widget.clear()
+        self._exclusion_set.clear()
+        self._update_destination_enabled_state(base_enabled=False)
+
     def _set_rule_toggle_enabled(self, enabled: bool) -> None:
         """Enable or disable the rule toggle and its helper text together."""
         self.enabledCheckbox.setEnabled(enabled)
@@ -1336,7 +1856,7 @@ class ConfigWindow(QWidget):
         current_item = self.folder_list_widget.currentItem()
         is_running = self.worker_status in {"Running", "Dry Run Active"}
         action_text = self.actionComboBox.currentText() if self.actionComboBox else "Move"
-        action_value = ACTION_TEXT_TO_VALUE.get(action_text, "move")
+        action_value = _action_text_to_value(action_text, "move")
 
         can_edit_rules = base_enabled and current_item is not None and not is_running
         allow_destination = can_edit_rules and action_value in {"move", "copy"}
@@ -1347,8 +1867,41 @@ class ConfigWindow(QWidget):
 
     @pyqtSlot()
     def save_rule_changes(self):
+        """Schedule a debounced save of the rule inputs for the selected folder.
+
+        Spin-box arrows, key repeat and combo churn all land here; the
+        single-shot timer coalesces a burst of edits into one config write.
+        """
+        timer = self._save_timer
+        if timer is None:
+            self._commit_rule_changes()
+            return
+        current_item = self.folder_list_widget.currentItem()
+        if current_item is not None:
+            self._pending_save_path = self._get_item_path(current_item)
+        timer.start()
+
+    def _flush_pending_rule_changes(self):
+        """Commit any scheduled rule save immediately."""
+        timer = self._save_timer
+        if timer is not None and timer.isActive():
+            timer.stop()
+            self._commit_rule_changes()
+        else:
+            self._pending_save_path = None
+
+    @pyqtSlot()
+    def _commit_rule_changes(self):
         """Save the current rule input values for the selected folder."""
+        pending_path = self._pending_save_path
+        self._pending_save_path = None
         current_item = self.folder_list_widget.currentItem()
+        if pending_path and (
+            current_item is None or self._get_item_path(current_item) != pending_path
+        ):
+            # Selection moved while a save was pending; the inputs still hold
+            # the values edited for the previous folder, so save against it.
+            current_item = self._find_folder_item_by_path(pending_path)
         if current_item:
             path = self._get_item_path(current_item)
             if not path:
@@ -1359,8 +1912,12 @@ class ConfigWindow(QWidget):
             rule_logic = self.rule_logic_combo.currentText()
             use_regex = self.useRegexCheckbox.isChecked()
 
-            action_text = self.actionComboBox.currentText()
-            action_value = ACTION_TEXT_TO_VALUE.get(action_text, "move")
+            action_index = self.actionComboBox.currentIndex()
+            action_value = (
+                ACTION_VALUES[action_index]
+                if 0 <= action_index < len(ACTION_VALUES)
+                else "move"
+            )
 
             # Show warning for permanent delete
             if action_value == "delete_permanently":
@@ -1373,7 +1930,7 @@ class ConfigWindow(QWidget):
                 # while "Delete Permanently" is still selected, it might show again.
                 # A better UX would be to connect this warning to the currentIndexChanged signal specifically for this option.
                 # However, sticking to the prompt's placement in save_rule_changes:
-                current_rule = self.config_manager.get_folder_rule(path)
+                current_rule = self._get_folder_rule_cached(path)
                 if not current_rule or current_rule.get('action') != "delete_permanently":
                     QMessageBox.warning(self, "Permanent Delete Warning",
                                         "Warning: 'Delete Permanently' will erase files irreversibly. "
@@ -1407,6 +1964,7 @@ class ConfigWindow(QWidget):
                 destination_folder=destination_text,
                 enabled=rule_enabled
             ):
+                self._config_dirty = True
                 self.log_queue.put(f"INFO: Updated rules for {path}")
             else:
                 # Should not happen if item exists
@@ -1428,25 +1986,56 @@ class ConfigWindow(QWidget):
         directory = QFileDialog.getExistingDirectory(self, "Select Destination Folder", start_dir)
         if directory:
             self.destination_lineedit.setText(directory)
-            self.save_rule_changes()
+            self._commit_rule_changes()  # Explicit action; persist synchronously
 
     @pyqtSlot()
     def open_settings_dialog(self):
         """Open the settings dialog window."""
-        dialog = SettingsDialog(self.config_manager, self) # Pass config manager and parent
+        # Built once and reused; the refresh re-reads current settings so a
+        # cached dialog never shows stale values.
+        dialog = self._settings_dialog
+        if dialog is None:
+            dialog = SettingsDialog(self.config_manager, self) # Pass config manager and parent
+            self._settings_dialog = dialog
+        else:
+            dialog.refresh_from_config()
         dialog.exec() # Show the dialog modally
+        self._refresh_notification_filter() # Notification level may have changed
+        self._dry_run_cache = None # Dry-run mode may have changed
         self._update_ui_for_status_and_mode() # Refresh UI after settings change
 
     @pyqtSlot()
     def open_undo_dialog(self):
         """Open the undo/history dialog window."""
+        # Deferred so window construction skips the dialog module and the
+        # manager's history-path setup until the history view is first used.
+        from ui_undo_dialog import UndoDialog
+        if self.undo_manager is None:
+            self.undo_manager = UndoManager(self.config_manager)
         dialog = UndoDialog(self.undo_manager, self.config_manager, self)
         dialog.exec()
 
+    def _get_dry_run_mode(self) -> bool:
+        """Cached dry-run flag; read per status tick, changed only in settings."""
+        cached = self._dry_run_cache
+        if cached is None:
+            if hasattr(self.config_manager, "get_dry_run_mode"):
+                cached = bool(self.config_manager.get_dry_run_mode())
+            elif hasattr(self.config_manager, "get_setting"):
+                cached = bool(self.config_manager.get_setting('dry_run_mode', False))
+            else:
+                cached = False
+            self._dry_run_cache = cached
+        return cached
+
     def _update_ui_for_status_and_mode(self):
         """Update UI elements based on worker status and dry run mode."""
+        if not self._ui_ready:
+            # Widgets don't exist yet; worker_status is re-applied when the
+            # deferred UI build runs on first show.
+            return
         is_running = self.worker_status == "Running" or self.worker_status == "Dry Run Active"
-        is_dry_run_mode = self.config_manager.get_setting('dry_run_mode', False)
+        is_dry_run_mode = self._get_dry_run_mode()
 
         self.start_button.setText("&Start Dry Run" if is_dry_run_mode and not is_running else "&Start Monitoring")
         self.start_button.setToolTip(
@@ -1476,43 +2065,34 @@ class ConfigWindow(QWidget):
         self.add_exclusion_button.setEnabled(can_edit_rules)
         self.remove_exclusion_button.setEnabled(can_edit_rules)
         self.exclusion_help_button.setEnabled(can_edit_rules) # Enable/disable help button
-        preview_button = getattr(self, "preview_rule_button", None)
-        if preview_button is not None and hasattr(preview_button, "setEnabled"):
-            preview_button.setEnabled(can_edit_rules)
+        self.preview_rule_button.setEnabled(can_edit_rules)
         self._update_destination_enabled_state(base_enabled=can_edit_rules)
         self.update_status_summary()
 
     def update_status_summary(self):
         """Refresh the status indicator and summary text based on current configuration."""
         status_text = self.worker_status or "Stopped"
-        normalized_status = status_text.lower()
-
-        if "error" in normalized_status:
-            indicator_color = "#dc3545"  # Red for error
-        elif "dry run" in normalized_status:
-            indicator_color = "#0d6efd"  # Blue for dry run
-        elif "running" in normalized_status:
-            indicator_color = "#28a745"  # Green for running
-        elif "stopped" in normalized_status:
-            indicator_color = "#6c757d"  # Grey for stopped
-        else:
-            indicator_color = "#6c757d"  # Default grey
 
-        status_indicator = getattr(self, "status_indicator", None)
-        if status_indicator is not None and hasattr(status_indicator, "setStyleSheet"):
-            status_indicator.setStyleSheet(
-                f"background-color: {indicator_color}; border-radius: 6px; border: 1px solid rgba(0, 0, 0, 0.2);"
-            )
-        status_label_widget = getattr(self, "status_label", None)
-        if status_label_widget is not None and hasattr(status_label_widget, "setText"):
-            status_label_widget.setText(status_text)
+        indicator_key = STATUS_INDICATOR_KEYS.get(status_text)
+        if indicator_key is None:
+            normalized_status = status_text.lower()
+            if "error" in normalized_status:
+                indicator_key = "error"
+            elif "dry run" in normalized_status:
+                indicator_key = "dry"
+            elif "running" in normalized_status:
+                indicator_key = "run"
+            else:
+                indicator_key = "stop"
 
-        if hasattr(self.config_manager, "get_dry_run_mode"):
-            dry_run_active = self.config_manager.get_dry_run_mode()
-        elif hasattr(self.config_manager, "get_setting"):
-            dry_run_active = bool(self.config_manager.get_setting('dry_run_mode', False))
-        else:
-            dry_run_active = False
+        if indicator_key != self._last_indicator_key:
+            self._last_indicator_key = indicator_key
+            self.status_indicator.setStyleSheet(INDICATOR_STYLES[indicator_key])
+        if status_text != self._last_status_text:
+            self._last_status_text = status_text
+            self.status_label.setText(status_text)
+
+        dry_run_active = self._get_dry_run_mode()
 
         if hasattr(self.config_manager, "get_schedule_config"):
             schedule_config = self.config_manager.get_schedule_config() or {}
@@ -1533,10 +2113,14 @@ class ConfigWindow(QWidget):
             )
         else:
             summary_parts.append("Next run: Not scheduled")
+        summary_text = " • ".join(summary_parts)
 
-        summary_label = getattr(self, "status_summary_label", None)
-        if summary_label is not None and hasattr(summary_label, "setText"):
-            summary_label.setText(" • ".join(summary_parts))
+        # The estimate embeds the wall clock, so the text is rebuilt every
+        # refresh and only the redundant setText/re-layout is skipped.
+        if summary_text == self._last_status_summary_state:
+            return
+        self._last_status_summary_state = summary_text
+        self.status_summary_label.setText(summary_text)
 
     def _get_selected_folder_path(self) -> Path | None:
         """Return the Path of the currently selected monitored folder."""
@@ -1578,13 +2162,18 @@ class ConfigWindow(QWidget):
         action_value = ACTION_TEXT_TO_VALUE.get(self.actionComboBox.currentText(), "move")
 
         if use_regex and pattern:
-            try:
-                re.compile(pattern)
-            except re.error as exc:
+            # Validate through the shared compile cache so the scan below
+            # (and any repeat previews) reuse the same compiled pattern.
+            if _compile_pattern(pattern) is None:
+                try:
+                    re.compile(pattern)
+                    detail = "Pattern compilation timed out."
+                except re.error as exc:
+                    detail = str(exc)
                 QMessageBox.critical(
                     self,
                     "Invalid Regular Expression",
-                    f"The provided pattern is not a valid regular expression:\n{exc}",
+                    f"The provided pattern is not a valid regular expression:\n{detail}",
                 )
                 return
 
@@ -1614,23 +2203,36 @@ class ConfigWindow(QWidget):
                 )
                 return
 
-        try:
-            matches = get_preview_matches(
-                folder_path,
-                age_days,
-                pattern,
-                use_regex,
-                rule_logic,
-            )
-        except (NotADirectoryError, PermissionError) as exc:
-            QMessageBox.critical(self, "Preview Failed", str(exc))
-            return
-        except Exception as exc:  # Catch-all for unexpected issues
-            QMessageBox.critical(
-                self,
-                "Preview Failed",
-                f"An unexpected error occurred while previewing the rule:\n{exc}",
-            )
+        if self._preview_task is not None:
+            return  # A scan is already running; its result dialog is pending.
+
+        # Scan on a pool thread so large folders never stall the event loop.
+        # The finished signal is emitted from the pool thread and hops back
+        # to the GUI thread via the automatic queued connection.
+        self.preview_rule_button.setEnabled(False)
+        task = _PreviewScanTask(folder_path, age_days, pattern, use_regex, rule_logic)
+        task.signals.finished.connect(self._on_preview_ready)
+        self._preview_task = task
+        self._preview_folder = folder_path
+        QThreadPool.globalInstance().start(task)
+
+    @pyqtSlot(list, object)
+    def _on_preview_ready(self, matches, error):
+        """Present preview results computed on the worker thread."""
+        folder_path = self._preview_folder
+        self._preview_task = None
+        self._preview_folder = None
+        self.preview_rule_button.setEnabled(True)
+
+        if error is not None:
+            if isinstance(error, (NotADirectoryError, PermissionError)):
+                QMessageBox.critical(self, "Preview Failed", str(error))
+            else:
+                QMessageBox.critical(
+                    self,
+                    "Preview Failed",
+                    f"An unexpected error occurred while previewing the rule:\n{error}",
+                )
             return
 
         dialog = QMessageBox(self)
@@ -1638,21 +2240,27 @@ class ConfigWindow(QWidget):
         dialog.setIcon(QMessageBox.Icon.Information)
 
         if matches:
-            relative_paths = []
+            # Stream the paths into one buffer rather than holding the list
+            # and the joined string at the same time on large previews.
+            buffer = io.StringIO()
+            displayed_count = 0
             for match in matches:
                 try:
-                    relative_paths.append(str(match.relative_to(folder_path)))
+                    relative_path = str(match.relative_to(folder_path))
                 except ValueError:
-                    relative_paths.append(str(match))
+                    relative_path = str(match)
+                if displayed_count:
+                    buffer.write("\n")
+                buffer.write(relative_path)
+                displayed_count += 1
 
-            displayed_count = len(relative_paths)
             dialog.setText(
                 (
                     f"Found {displayed_count} matching file(s) in {folder_path}.\n"
                     "Showing up to 10 results."
                 )
             )
-            dialog.setInformativeText("\n".join(relative_paths))
+            dialog.setInformativeText(buffer.getvalue())
         else:
             dialog.setText("No files currently match the configured rule.")
             dialog.setInformativeText(f"Folder checked: {folder_path}")
@@ -1663,12 +2271,13 @@ class ConfigWindow(QWidget):
     @pyqtSlot()
     def start_monitoring(self):
         """Start the background monitoring worker thread."""
+        self._flush_pending_rule_changes()
         if self.monitoring_worker and self.monitoring_worker.is_alive():
-            dry_run_active = self.config_manager.get_dry_run_mode()
+            dry_run_active = self._get_dry_run_mode()
             self.log_queue.put(f"INFO: {'Dry run' if dry_run_active else 'Monitoring'} is already running.")
             return
 
-        dry_run_active = self.config_manager.get_dry_run_mode()
+        dry_run_active = self._get_dry_run_mode()
         self.log_queue.put(f"INFO: Starting {'dry run' if dry_run_active else 'monitoring'}...")
 
         self.monitoring_worker = MonitoringWorker(
@@ -1676,6 +2285,7 @@ class ConfigWindow(QWidget):
             self.log_queue
         )
         self.monitoring_worker.start()
+        self._set_log_timer_interval(LOG_QUEUE_CHECK_INTERVAL_MS)
         self.worker_status = "Dry Run Active" if dry_run_active else "Running"
         self._update_ui_for_status_and_mode()
         # self.worker_status will be updated by message from worker, then _update_ui_for_status_and_mode
@@ -1702,32 +2312,54 @@ class ConfigWindow(QWidget):
             # self._update_ui_for_status_and_mode()
 
 
+    def _refresh_notification_filter(self):
+        """Drop the cached notification filter; recomputed on next use."""
+        self._allowed_categories = _NOTIFICATION_FILTER_UNSET
+
     def _should_show_notification(self, category: str) -> bool:
-        level = self.config_manager.get_notification_level()
-        if level == NOTIFICATION_LEVEL_NONE:
-            return False
-        if level == NOTIFICATION_LEVEL_ERROR:
-            return category == "error"
-        if level == NOTIFICATION_LEVEL_SUMMARY:
-            return category in {"summary", "error"}
-        return True
+        allowed = self._allowed_categories
+        if allowed is _NOTIFICATION_FILTER_UNSET:
+            level = self.config_manager.get_notification_level()
+            allowed = NOTIFICATION_LEVEL_CATEGORIES.get(level)
+            self._allowed_categories = allowed
+        if allowed is None:
+            return True  # "All" (or unknown) level passes every category.
+        return category in allowed
 
     @pyqtSlot()
     def check_log_queue(self):
         """Check the queue for messages from the worker thread and update UI."""
+        batch: list[tuple[datetime, str, str]] = []
+        get_message = self.log_queue.get_nowait
+        processed = 0
+        budget = QElapsedTimer() if callable(QElapsedTimer) else None
+        if budget is not None:
+            budget.start()
+        # Snapshot how much to drain so the loop exits by count instead of
+        # raising queue.Empty every tick; messages that arrive mid-drain are
+        # picked up by the zero-delay continuation below.
+        pending = min(self.log_queue.qsize(), LOG_QUEUE_DRAIN_LIMIT)
         try:
-            while True: # Process all messages currently in queue
-                message = self.log_queue.get_nowait()
+            while processed < pending:
+                if budget is not None and budget.elapsed() > LOG_QUEUE_DRAIN_BUDGET_MS:
+                    break
+                message = get_message()
+                processed += 1
                 if isinstance(message, dict) and message.get("type") == "SHOW_NOTIFICATION":
                     category = message.get("category", "info")
                     if self._should_show_notification(category):
-                        app_instance = QApplication.instance()
-                        # Check if it's an instance of our AutoTidyApp (which has the method)
-                        if app_instance and hasattr(app_instance, 'show_system_notification') and callable(getattr(app_instance, 'show_system_notification')):
+                        # Resolve the AutoTidyApp notification method once and
+                        # reuse the bound callable on subsequent messages.
+                        notify = self._notify_fn
+                        if notify is None:
+                            app_instance = QApplication.instance()
+                            candidate = getattr(app_instance, 'show_system_notification', None)
+                            if callable(candidate):
+                                notify = self._notify_fn = candidate
+                        if notify is not None:
                             title = message.get("title", "AutoTidy")
                             body = message.get("message", "")
-                            # Explicitly call, relying on the hasattr check
-                            getattr(app_instance, 'show_system_notification')(title, body)
+                            notify(title, body)
                         else:
                             logger.debug(
                                 "AutoTidyApp instance not found or no show_system_notification method for: %s",
@@ -1740,8 +2372,8 @@ class ConfigWindow(QWidget):
                             message.get("title"),
                         )
                 elif isinstance(message, str) and message.startswith("STATUS:"):
-                    reported_status = message.split(":", 1)[1].strip()
-                    if reported_status.lower().startswith("running") and self.config_manager.get_dry_run_mode():
+                    reported_status = message[len("STATUS:"):].strip()
+                    if reported_status.lower().startswith("running") and self._get_dry_run_mode():
                         self.worker_status = "Dry Run Active"
                     else:
                         self.worker_status = reported_status
@@ -1760,25 +2392,40 @@ class ConfigWindow(QWidget):
 
 
                 elif isinstance(message, str): # Ensure only strings are appended directly
+                    # STATUS messages never reach this branch, so no second
+                    # prefix check is needed. Entries are stored immediately
+                    # but rendered once per drain below.
                     severity = self._determine_log_severity(message)
-                    # STATUS messages are handled above and should not be double logged
-                    if not message.startswith("STATUS:"):
-                        self._append_log_entry(severity, message)
+                    batch.append(self._record_log_entry(severity, message))
                 else:
                     # Handle or log unexpected message types if necessary
                     logger.debug("Received unexpected message type in log queue: %s", type(message))
 
         except queue.Empty:
-            # No messages left in the queue
+            # qsize() is advisory, so an emptied queue is still possible.
             pass
         except Exception as e:
             # Avoid crashing the UI thread if there's an issue processing logs
             logger.exception("Error processing log queue: %s", e)
-            self.log_view.append(f'<font color="red">ERROR: UI failed to process log message: {e}</font>')
-
-        # Also check if thread died unexpectedly without sending STATUS: Stopped
-        if self.monitoring_worker and not self.monitoring_worker.is_alive() and self.worker_status == "Running":
-            self.log_queue.put("STATUS: Stopped (Unexpectedly)")
+            if self._ui_ready:
+                batch.append(self._record_log_entry("ERROR", f"UI failed to process log message: {e}"))
+
+        self._render_log_entries(batch)
+
+        # If the time budget or drain cap left messages queued, continue on a
+        # zero-delay timer so paints and input stay interleaved with draining.
+        if not self.log_queue.empty():
+            QTimer.singleShot(0, self.check_log_queue)
+
+        # The worker posts its own terminal STATUS from a finally block, so
+        # no per-tick liveness poll is needed; the running flag is a plain
+        # attribute read the worker clears on exit.
+        # Back off the poll rate while idle; a live worker (or a drain that
+        # produced output) keeps the fast interval.
+        worker_active = bool(self.monitoring_worker and self.monitoring_worker.running)
+        self._set_log_timer_interval(
+            LOG_QUEUE_CHECK_INTERVAL_MS if worker_active or batch else LOG_QUEUE_IDLE_INTERVAL_MS
+        )
 
 
     def closeEvent(self, event):
@@ -1794,16 +2441,28 @@ class ConfigWindow(QWidget):
             else:
                 self.log_queue.put("ERROR: MonitoringWorker does not have a stop method.")
 
-        # Save any pending changes (e.g., if user typed in a field and closed)
-        # self.save_rule_changes() # This might be redundant if changes are saved on field edit
+        # Flush any debounced rule edit before the final config save
+        self._flush_pending_rule_changes()
 
         self.log_timer.stop() # Stop the log timer
-        self.config_manager.save_config() # Ensure config is saved
+        # Skip the JSON serialize/write when the session never edited the
+        # config; piecewise-built windows default to dirty and still save.
+        # The save itself runs off the UI thread so the close is not blocked
+        # on disk I/O; the brief join guarantees the flush lands before the
+        # process exits.
+        if self._config_dirty:
+            save_thread = threading.Thread(
+                target=self.config_manager.save_config,
+                name="AutoTidyConfigSave",
+            )
+            save_thread.start()
+            save_thread.join(timeout=1.0)
+            self._config_dirty = False
         self.log_queue.put("INFO: AutoTidy configuration window closed.")
         super().closeEvent(event)
 
-    def show_template_menu(self):
-        """Show a context menu with rule templates."""
+    def _build_template_menu(self) -> QMenu:
+        """Create the rule-template menu and its actions."""
         template_menu = QMenu(self)
         if not RULE_TEMPLATES:
             no_template_action = QAction("No templates available", self) # Create QAction
@@ -1816,11 +2475,18 @@ class ConfigWindow(QWidget):
                 action.setData(i) # Store index of the template
                 action.triggered.connect(self.apply_selected_template)
                 template_menu.addAction(action) # Add QAction to menu
-        
-        self.apply_template_button.setMenu(template_menu) # Associate menu with button
+        return template_menu
+
+    def show_template_menu(self):
+        """Show a context menu with rule templates."""
+        # RULE_TEMPLATES is static, so the menu and its actions are built
+        # once on first click and reused on later presses.
+        if self._template_menu is None:
+            self._template_menu = self._build_template_menu()
+            self.apply_template_button.setMenu(self._template_menu) # Associate menu with button
         # Position menu below the button. Adjust x, y as needed for better positioning.
         menu_pos = self.apply_template_button.mapToGlobal(self.apply_template_button.rect().bottomLeft())
-        template_menu.popup(menu_pos)
+        self._template_menu.popup(menu_pos)
 
 
     def apply_selected_template(self):
@@ -1849,61 +2515,32 @@ class ConfigWindow(QWidget):
 
                 if reply == QMessageBox.StandardButton.Yes:
                     folders_added_or_updated = []
-                    for rule_def in template_rules:
-                        folder_path = rule_def.get('folder_to_watch')
-                        if not folder_path:
-                            self.log_queue.put(f"WARNING: Template rule in '{template_name}' missing 'folder_to_watch'. Skipping.")
-                            continue
-                        
-                        # Expand environment variables in paths
-                        expanded_folder_path = os.path.expandvars(folder_path)
-                        expanded_dest_folder = os.path.expandvars(rule_def.get('destination_folder', ''))
-
-                        # Check if folder already exists in list, if not, add it
-                        existing_item_paths = []
-                        for i in range(self.folder_list_widget.count()):
-                            item = self.folder_list_widget.item(i)
-                            if item:
-                                existing_item_paths.append(self._get_item_path(item))
-                        
-                        normalized_action = self.config_manager.normalize_action(rule_def.get('action', 'move'))
-                        normalized_rule_def = dict(rule_def)
-                        normalized_rule_def['action'] = normalized_action
-                        normalized_rule_def['destination_folder'] = expanded_dest_folder
-
-                        if expanded_folder_path not in existing_item_paths:
-                            if self.config_manager.add_folder(expanded_folder_path, normalized_rule_def): # Add with template rule
-                                list_item = QListWidgetItem()
-                                self._set_folder_item_path(list_item, expanded_folder_path)
-                                self._refresh_folder_item_display(list_item)
-                                self.folder_list_widget.addItem(list_item)
-                                folders_added_or_updated.append(expanded_folder_path)
-                                self.log_queue.put(f"INFO: Added folder '{expanded_folder_path}' from template '{template_name}'.")
-                            else:
-                                self.log_queue.put(f"INFO: Folder '{expanded_folder_path}' (from template) likely already in config, attempting to update rule.")
-
-                        update_success = self.config_manager.update_folder_rule(
-                            path=expanded_folder_path,
-                            age_days=rule_def.get('days_older_than', 0),
-                            pattern=rule_def.get('file_pattern', '*.*'),
-                            rule_logic=rule_def.get('rule_logic', 'OR'),
-                            use_regex=rule_def.get('use_regex', False),
-                            action=normalized_action,
-                            exclusions=rule_def.get('exclusions', []),
-                            destination_folder=expanded_dest_folder,
-                            enabled=rule_def.get('enabled', True)
+                    # Snapshot the existing paths once from the index;
+                    # rebuilding this inside the loop made template
+                    # application O(rules x folders).
+                    existing_item_paths = set(self._folder_items)
+
+                    # Apply the whole template as one visual batch: repaints
+                    # and selection signals resume before the current item is
+                    # set below, so the UI refreshes once instead of per rule.
+                    list_widget = self.folder_list_widget
+                    blocker = QSignalBlocker(list_widget)
+                    if hasattr(list_widget, "setUpdatesEnabled"):
+                        list_widget.setUpdatesEnabled(False)
+                    try:
+                        self._apply_template_rules(
+                            template_name,
+                            template_rules,
+                            existing_item_paths,
+                            folders_added_or_updated,
                         )
-                        if update_success:
-                            if expanded_folder_path not in folders_added_or_updated:
-                                folders_added_or_updated.append(expanded_folder_path)
-                            existing_item = self._find_folder_item_by_path(expanded_folder_path)
-                            if existing_item is not None:
-                                self._refresh_folder_item_display(existing_item)
-                            self.log_queue.put(f"INFO: Applied rule from template '{template_name}' to folder '{expanded_folder_path}'.")
-                        else:
-                            self.log_queue.put(f"ERROR: Failed to apply rule from template '{template_name}' to folder '{expanded_folder_path}'.")
+                    finally:
+                        if hasattr(list_widget, "setUpdatesEnabled"):
+                            list_widget.setUpdatesEnabled(True)
+                        del blocker
 
                     if folders_added_or_updated:
+                        self._config_dirty = True
                         QMessageBox.information(self, "Template Applied",
                                                 f"Template '{template_name}' applied. Rules for the following folders were added/updated:\n" +
                                                 "\n".join(folders_added_or_updated) +
@@ -1927,6 +2564,62 @@ class ConfigWindow(QWidget):
         else:
             self.log_queue.put("ERROR: apply_selected_template called by a non-QAction sender.")
 
+    def _apply_template_rules(self, template_name, template_rules, existing_item_paths, folders_added_or_updated):
+        """Apply each template rule, adding or updating folders in place."""
+        for rule_def in template_rules:
+            folder_path = rule_def.get('folder_to_watch')
+            if not folder_path:
+                self.log_queue.put(f"WARNING: Template rule in '{template_name}' missing 'folder_to_watch'. Skipping.")
+                continue
+
+            # Expand environment variables in paths
+            expanded_folder_path = _expandvars_cached(folder_path)
+            expanded_dest_folder = _expandvars_cached(rule_def.get('destination_folder', ''))
+
+            normalized_action = self.config_manager.normalize_action(rule_def.get('action', 'move'))
+            normalized_rule_def = dict(rule_def)
+            normalized_rule_def['action'] = normalized_action
+            normalized_rule_def['destination_folder'] = expanded_dest_folder
+
+            # Normalise the rule fields once; the update call below binds
+            # them by unpacking instead of repeating the .get defaults.
+            rule_kwargs = {
+                'age_days': rule_def.get('days_older_than', 0),
+                'pattern': rule_def.get('file_pattern', '*.*'),
+                'rule_logic': rule_def.get('rule_logic', 'OR'),
+                'use_regex': rule_def.get('use_regex', False),
+                'action': normalized_action,
+                'exclusions': rule_def.get('exclusions', []),
+                'destination_folder': expanded_dest_folder,
+                'enabled': rule_def.get('enabled', True),
+            }
+
+            if expanded_folder_path not in existing_item_paths:
+                if self.config_manager.add_folder(expanded_folder_path, normalized_rule_def): # Add with template rule
+                    list_item = QListWidgetItem()
+                    self._set_folder_item_path(list_item, expanded_folder_path)
+                    self._refresh_folder_item_display(list_item)
+                    self.folder_list_widget.addItem(list_item)
+                    self._folder_items[expanded_folder_path] = list_item
+                    existing_item_paths.add(expanded_folder_path)
+                    folders_added_or_updated.append(expanded_folder_path)
+                    self.log_queue.put(f"INFO: Added folder '{expanded_folder_path}' from template '{template_name}'.")
+                else:
+                    self.log_queue.put(f"INFO: Folder '{expanded_folder_path}' (from template) likely already in config, attempting to update rule.")
+
+            update_success = self.config_manager.update_folder_rule(
+                path=expanded_folder_path, **rule_kwargs
+            )
+            if update_success:
+                if expanded_folder_path not in folders_added_or_updated:
+                    folders_added_or_updated.append(expanded_folder_path)
+                existing_item = self._find_folder_item_by_path(expanded_folder_path)
+                if existing_item is not None:
+                    self._refresh_folder_item_display(existing_item)
+                self.log_queue.put(f"INFO: Applied rule from template '{template_name}' to folder '{expanded_folder_path}'.")
+            else:
+                self.log_queue.put(f"ERROR: Failed to apply rule from template '{template_name}' to folder '{expanded_folder_path}'.")
+
 
     # Placeholder methods for exclusion functionality to resolve linting errors
     # These should be implemented or connected to actual logic if it exists elsewhere.
@@ -1950,12 +2643,7 @@ class ConfigWindow(QWidget):
             QMessageBox.warning(self, "Invalid Pattern", "The exclusion pattern cannot be empty.")
             return
 
-        existing_patterns = {
-            self.exclusion_list_widget.item(i).text()
-            for i in range(self.exclusion_list_widget.count())
-        }
-
-        if pattern in existing_patterns:
+        if pattern in self._exclusion_set:
             QMessageBox.information(self, "Duplicate Pattern", "This exclusion pattern already exists.")
             return
 
@@ -1964,8 +2652,9 @@ class ConfigWindow(QWidget):
         item.setFlags(item.flags() | Qt.ItemFlag.ItemIsEditable)
         self.exclusion_list_widget.addItem(item)
         self.exclusion_list_widget.blockSignals(False)
+        self._exclusion_set.add(pattern)
 
-        self.save_rule_changes()
+        self._commit_rule_changes()  # Explicit action; persist synchronously
         folder_path = self._get_item_path(self.folder_list_widget.currentItem())
         if folder_path:
             self.log_queue.put(f"INFO: Added exclusion pattern '{pattern}' for {folder_path}.")
@@ -1995,7 +2684,8 @@ class ConfigWindow(QWidget):
 
         row = self.exclusion_list_widget.row(current_item)
         self.exclusion_list_widget.takeItem(row)
-        self.save_rule_changes()
+        self._exclusion_set.discard(pattern)
+        self._commit_rule_changes()  # Explicit action; persist synchronously
         folder_path = self._get_item_path(self.folder_list_widget.currentItem())
         if folder_path:
             self.log_queue.put(f"INFO: Removed exclusion pattern '{pattern}' for {folder_path}.")
@@ -2003,29 +2693,7 @@ class ConfigWindow(QWidget):
     def show_exclusion_pattern_help(self):
         self.log_queue.put("INFO: Show exclusion pattern help clicked.")
 
-        glob_list_html = "".join(
-            f"<li><code>{html.escape(pattern)}</code> – {html.escape(description)}</li>"
-            for pattern, description in EXCLUSION_HELP_CONTENT["glob_examples"]
-        )
-        regex_list_html = "".join(
-            f"<li><code>{html.escape(pattern)}</code> – {html.escape(description)}</li>"
-            for pattern, description in EXCLUSION_HELP_CONTENT["regex_examples"]
-        )
-        logic_list_html = "".join(
-            f"<li>{html.escape(note)}</li>"
-            for note in EXCLUSION_HELP_CONTENT["logic_notes"]
-        )
-
-        message_html = (
-            f"<p>{html.escape(EXCLUSION_HELP_CONTENT['intro'])}</p>"
-            "<h4>Wildcard (glob) examples</h4>"
-            f"<ul>{glob_list_html}</ul>"
-            "<h4>Regular expression examples</h4>"
-            f"<ul>{regex_list_html}</ul>"
-            "<h4>How exclusions interact with rule logic</h4>"
-            f"<ul>{logic_list_html}</ul>"
-            "<p><a href='learn_more_exclusions'>Learn more in the README</a></p>"
-        )
+        message_html = _EXCLUSION_HELP_HTML
 
         # QMessageBox does not expose a linkActivated signal. Build a small dialog
         # with a QLabel that supports rich text links and connect that signal.
@@ -2069,6 +2737,12 @@ class ConfigWindow(QWidget):
     def save_exclusion_list_changes(self, item: QListWidgetItem):
         if item:
             self.log_queue.put(f"INFO: Updated exclusion pattern to '{item.text()}'.")
+        # In-place edits do not reveal the previous text, so rebuild the
+        # mirror set from the widget; edits are rare and the list is small.
+        self._exclusion_set = {
+            self.exclusion_list_widget.item(i).text()
+            for i in range(self.exclusion_list_widget.count())
+        }
         self.save_rule_changes() # Re-use save_rule_changes to update the whole rule including exclusions
 
 
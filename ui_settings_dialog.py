@@ -281,6 +281,25 @@ class SettingsDialog(QDialog):
         # QDialog typically handles Enter for default button and Esc for reject.
         pass # Relying on QDialogButtonBox and QDialog default handling for Enter/Esc
 
+    def refresh_from_config(self):
+        """Re-read settings into the widgets so a reused dialog is not stale."""
+        self.initial_start_on_login = self.config_manager.get_setting("start_on_login", False)
+        self.initial_archive_template = self.config_manager.get_archive_path_template()
+        self.initial_schedule_config = self.config_manager.get_schedule_config()
+        self.initial_dry_run_mode = self.config_manager.get_dry_run_mode()
+        self.initial_notification_level = self.config_manager.get_notification_level()
+
+        self.autostart_checkbox.setChecked(self.initial_start_on_login)
+        self.dryRunModeCheckbox.setChecked(self.initial_dry_run_mode)
+        level_index = self.notificationLevelComboBox.findData(self.initial_notification_level)
+        if level_index == -1:
+            level_index = self.notificationLevelComboBox.findData(DEFAULT_NOTIFICATION_LEVEL)
+        if level_index != -1:
+            self.notificationLevelComboBox.setCurrentIndex(level_index)
+        self.intervalMinutesSpinBox.setValue(self.initial_schedule_config.get('interval_minutes', 60))
+        self.archivePathTemplateInput.setText(self.initial_archive_template)
+        self._update_next_run_status_label()
+
     # def create_action(self, text, slot, shortcut=None): # Helper for explicit actions if needed
     #     from PyQt6.QtGui import QAction
     #     action = QAction(text, self)
@@ -4,6 +4,7 @@ import shutil
 import fnmatch
 import sys
 import logging
+import queue
 import re
 import functools
 import send2trash
@@ -14,23 +15,59 @@ from typing import List
 
 logger = logging.getLogger(__name__)
 
+try:  # Optional faster engine with the same API; stdlib re is the fallback.
+    import regex as _regex_backend  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    _regex_backend = re
+
 _regex_executor = ThreadPoolExecutor(max_workers=1)
 
 
-@functools.lru_cache(maxsize=256)
-def _compile_pattern(pattern: str) -> "re.Pattern | None":
-    """Compile a regex pattern once, with timeout protection on first call.
+class BoundedLogQueue(queue.Queue):
+    """A queue.Queue that drops its oldest entry instead of blocking when full.
 
-    Result is cached for the lifetime of the process, so per-file matching
-    incurs no thread overhead after the first compilation.
+    The worker logs far faster than the UI drains during a large scan; with
+    an unbounded queue that backlog grows without limit, and with a plain
+    bounded queue a full buffer would block the producer (or, worse, the UI
+    thread, which both fills and drains it). Dropping the oldest entry keeps
+    memory and drain cost bounded while preserving the newest messages.
     """
+
+    def put(self, item, block=True, timeout=None):
+        while True:
+            try:
+                super().put(item, block=False)
+                return
+            except queue.Full:
+                try:
+                    self.get_nowait()
+                except queue.Empty:
+                    pass
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(pattern: str, use_regex: bool = True) -> "re.Pattern | None":
+    """Compile a pattern once, with timeout protection on first call.
+
+    Glob patterns (``use_regex=False``) are translated via ``fnmatch`` and
+    compiled directly; user-supplied regexes go through the timeout-protected
+    path. Results are cached for the lifetime of the process, so per-file
+    matching incurs no translation or thread overhead after the first call.
+    Compilation uses the third-party ``regex`` module when it is installed;
+    it is a drop-in replacement for ``re`` with a faster matcher.
+    """
+    if not use_regex:
+        try:
+            return _regex_backend.compile(fnmatch.translate(pattern))
+        except (re.error, _regex_backend.error):
+            return None
     try:
-        future = _regex_executor.submit(re.compile, pattern)
+        future = _regex_executor.submit(_regex_backend.compile, pattern)
         return future.result(timeout=2.0)
     except FuturesTimeout:
         logger.warning("Regex pattern '%s' timed out during compilation", pattern)
         return None
-    except re.error:
+    except (re.error, _regex_backend.error):
         return None
 
 
@@ -144,7 +181,11 @@ def check_file(
                     logger.error("Invalid regex pattern '%s' for file %s: %s", pattern, file_path.name, e)
                     # Treat as non-match if regex is invalid
             else:
-                if fnmatch.fnmatch(file_path.name, pattern):
+                # Same semantics as fnmatch.fnmatch, but the translated
+                # pattern is compiled once and cached instead of re-resolved
+                # per file.
+                compiled = _compile_pattern(os.path.normcase(pattern), use_regex=False)
+                if compiled is not None and compiled.match(os.path.normcase(file_path.name)):
                     pattern_match = True # Matches fnmatch pattern criteria
 
         logic = (rule_logic or "OR").upper()
@@ -160,6 +201,53 @@ def check_file(
         return False
 
 
+def build_matcher(pattern: str, use_regex: bool, age_days: int, rule_logic: str = "OR"):
+    """Build a fused predicate for a rule's pattern, age and logic.
+
+    Returns ``matcher(name, get_mtime)`` where ``get_mtime`` is a zero-arg
+    callable yielding the file's mtime (or ``None`` if unavailable). The
+    pattern is compiled and the age threshold prebound once, so per-file
+    evaluation is a single call with no re-parsing — and ``get_mtime`` is
+    only invoked when the logic actually needs the file's age.
+    """
+    compiled = None
+    if pattern:
+        if use_regex:
+            compiled = _compile_pattern(pattern)
+        else:
+            compiled = _compile_pattern(os.path.normcase(pattern), use_regex=False)
+    cutoff = (
+        (datetime.now() - timedelta(days=age_days)).timestamp() if age_days > 0 else None
+    )
+    logic_is_and = (rule_logic or "OR").upper() == "AND"
+
+    if use_regex:
+        def _name_matches(name: str) -> bool:
+            return compiled is not None and compiled.fullmatch(name) is not None
+    else:
+        def _name_matches(name: str) -> bool:
+            return compiled is not None and compiled.match(os.path.normcase(name)) is not None
+
+    if logic_is_and:
+        def matcher(name: str, get_mtime) -> bool:
+            if not _name_matches(name):
+                return False
+            if cutoff is None:
+                return True
+            mtime = get_mtime()
+            return mtime is not None and mtime < cutoff
+    else:
+        def matcher(name: str, get_mtime) -> bool:
+            if _name_matches(name):
+                return True
+            if cutoff is None:
+                return True
+            mtime = get_mtime()
+            return mtime is not None and mtime < cutoff
+
+    return matcher
+
+
 def get_preview_matches(
     monitored_folder: Path,
     age_days: int,
@@ -188,6 +276,18 @@ def get_preview_matches(
     if not monitored_folder.is_dir():
         raise NotADirectoryError(f"{monitored_folder} is not a directory")
 
+    # The rule is fused into one predicate: the pattern is compiled once,
+    # the age threshold reduced to a single mtime comparison, and the loop
+    # body is a name match plus (at most) one stat per entry.
+    matcher = build_matcher(pattern, use_regex, age_days, rule_logic)
+
+    def _entry_mtime(entry):
+        try:
+            return entry.stat(follow_symlinks=False).st_mtime
+        except OSError as stat_err:
+            logger.warning("Could not stat %s during preview: %s", entry.path, stat_err)
+            return None
+
     matches: List[Path] = []
     try:
         with os.scandir(str(monitored_folder)) as scanner:
@@ -198,9 +298,8 @@ def get_preview_matches(
                 continue
             if not entry.is_file(follow_symlinks=False):
                 continue
-            entry_stat = entry.stat(follow_symlinks=False)
-            if check_file(Path(entry.path), age_days, pattern, use_regex, rule_logic,
-                          precomputed_stat=entry_stat):
+
+            if matcher(entry.name, lambda entry=entry: _entry_mtime(entry)):
                 matches.append(Path(entry.path))
                 if len(matches) >= max_results:
                     break
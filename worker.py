@@ -67,6 +67,22 @@ class MonitoringWorker(threading.Thread):
         self.log_queue.put("INFO: Monitoring worker started.")
         self.log_queue.put("STATUS: Running")
 
+        # The finally block below guarantees a terminal status message even
+        # if a cycle raises, so the UI never needs to poll thread liveness.
+        stopped_status = "STATUS: Stopped"
+        try:
+            self._run_cycles()
+        except Exception as e:
+            logger.exception("Monitoring worker crashed: %s", e)
+            self._log_error(f"Monitoring stopped unexpectedly: {e}")
+            stopped_status = "STATUS: Stopped (Unexpectedly)"
+        finally:
+            self.running = False
+            self.log_queue.put("INFO: Monitoring worker stopped.")
+            self.log_queue.put(stopped_status)
+
+    def _run_cycles(self):
+        """Scan/sleep until the stop event is set."""
         while not self._stop_event.is_set():
             current_run_id = str(uuid.uuid4()) # Generate run_id for this cycle
             # Get the list of folders specifically
@@ -239,11 +255,6 @@ class MonitoringWorker(threading.Thread):
             self.log_queue.put(f"INFO: Next check in {interval_minutes} minute(s)...")
             self._stop_event.wait(sleep_duration_seconds)
 
-        self.running = False
-        self.log_queue.put("INFO: Monitoring worker stopped.")
-        self.log_queue.put("STATUS: Stopped")
-
-
     def stop(self):
         """Signals the worker thread to stop."""
         self._stop_event.set()